@@ -2,6 +2,7 @@ from typing import Optional
 import os
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 import browser_cookie3 as browsercookie
 import logging
 import traceback
@@ -11,6 +12,8 @@ from typing import Any
 import threading
 from concurrent.futures import ThreadPoolExecutor
 import math
+import shutil
+from urllib.parse import urlparse
 
 from utils import utils
 from utils.exceptions import DownloadError, BrowserCookieError
@@ -22,10 +25,12 @@ logger = Logger.get_logger(__name__)
 class FileDownloader:
     CHUNK_SIZE = 8192  # 8KB chunks
     MIN_CHUNK_SIZE = 1024 * 1024  # 1MB minimum chunk size for parallel downloads
+    PROGRESS_INTERVAL = 0.1  # Post at most ~10 progress updates per second
     
     @staticmethod
     def download(url: str, dest_folder: str, progress_queue: Any, thread_count: int = 4, cancel_event: mp.Event = None) -> None:
         """Download a file from a URL to the destination folder using multiple threads"""
+        temp_files = []  # Chunk files removed again on failure
         try:
             logger.info(f"Starting download from {url}")
             progress_queue.put({'type': 'status', 'message': 'Initializing download...'})
@@ -53,6 +58,12 @@ class FileDownloader:
                     'message': 'Browser cookies not available, continuing without them...'
                 })
             
+            # One pooled connection per download thread, so ranged requests to
+            # the same host reuse warm connections instead of being discarded
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=thread_count)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            
             # Setup session with headers
             session.headers.update({
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -70,66 +81,103 @@ class FileDownloader:
                 
             # Calculate chunk size based on file size and thread count
             chunk_size = max(FileDownloader.MIN_CHUNK_SIZE, math.ceil(total_size / thread_count))
-            chunks = [(start, min(start + chunk_size - 1, total_size))
+            chunks = [(start, min(start + chunk_size, total_size) - 1)
                      for start in range(0, total_size, chunk_size)]
             
-            # Create temporary files for each chunk
-            temp_files = [dest_path.with_suffix(f'.part{i}')
+            # Create temporary files for each chunk; appending to the full name
+            # keeps "a.zip" and "a.tar" downloads from sharing part files
+            part_files = [dest_path.with_name(f'{dest_path.name}.part{i}')
                          for i in range(len(chunks))]
+            # Chunks are combined here and then moved into place in one step,
+            # so an interrupted combine never leaves a truncated file behind
+            combined_path = dest_path.with_name(f'{dest_path.name}.tmp')
+            temp_files = part_files + [combined_path]
             
-            # Shared variables for progress tracking
-            downloaded = mp.Value('i', 0)
-            lock = threading.Lock()
+            # Bytes received per chunk; each worker only writes its own slot, so
+            # counting needs no lock and the total is summed when posting
+            chunk_downloaded = [0] * len(chunks)
+            lock = threading.Lock()  # Serializes progress posts only
             start_time = time.time()
+            last_post = [0.0]  # Time of the last progress update sent to the UI
+            
+            def post_progress(now):
+                last_post[0] = now
+                downloaded = sum(chunk_downloaded)
+                elapsed = now - start_time
+                speed = downloaded / elapsed if elapsed > 0 else 0
+                
+                # Format values for progress
+                speed_str = f"{speed/1024/1024:.1f}MB/s"
+                downloaded_str = f"{downloaded/1024/1024:.1f}MB"
+                total_str = f"{total_size/1024/1024:.1f}MB"
+                
+                progress = {
+                    'type': 'progress',
+                    'data': {
+                        'progress': (downloaded / total_size) * 100,
+                        'speed': speed_str,
+                        'downloaded': downloaded_str,
+                        'total': total_str
+                    }
+                }
+                progress_queue.put(progress)
             
             def download_chunk(chunk_info):
-                chunk_start, chunk_end = chunks[chunk_info[0]]
-                temp_file = chunk_info[1]
+                index, temp_file = chunk_info
+                chunk_start, chunk_end = chunks[index]
                 
                 headers = {'Range': f'bytes={chunk_start}-{chunk_end}'}
                 response = session.get(url, headers=headers, stream=True)
+                response.raise_for_status()
                 
                 with open(temp_file, 'wb') as f:
                     for chunk in response.iter_content(chunk_size=FileDownloader.CHUNK_SIZE):
+                        if cancel_event and cancel_event.is_set():
+                            f.close()
+                            temp_file.unlink()
+                            return
                         if chunk:
                             f.write(chunk)
+                            chunk_downloaded[index] += len(chunk)
+                            now = time.time()
+                            # Coalesce per-chunk updates
+                            if now - last_post[0] < FileDownloader.PROGRESS_INTERVAL:
+                                continue
                             with lock:
-                                downloaded.value += len(chunk)
-                                elapsed = time.time() - start_time
-                                speed = downloaded.value / elapsed if elapsed > 0 else 0
+                                post_progress(now)
                                 
-                                # Format values for progress
-                                speed_str = f"{speed/1024/1024:.1f}MB/s"
-                                downloaded_str = f"{downloaded.value/1024/1024:.1f}MB"
-                                total_str = f"{total_size/1024/1024:.1f}MB"
-                                
-                                progress = {
-                                    'type': 'progress',
-                                    'data': {
-                                        'progress': (downloaded.value / total_size) * 100,
-                                        'speed': speed_str,
-                                        'downloaded': downloaded_str,
-                                        'total': total_str
-                                    }
-                                }
-                                progress_queue.put(progress)
-                                if cancel_event and cancel_event.is_set():
-                                    f.close()
-                                    temp_file.unlink()
-                                    return
+                # Always report a finished chunk, so the last one to finish sends 100%
+                with lock:
+                    post_progress(time.time())
                             
             # Download chunks in parallel
             with ThreadPoolExecutor(max_workers=thread_count) as executor:
-                executor.map(download_chunk, enumerate(temp_files))
-            
-            # Combine all chunks
-            with open(dest_path, 'wb') as dest:
+                # Consume the results so an exception in any chunk is raised here
+                list(executor.map(download_chunk, enumerate(part_files)))
+                
+            if cancel_event and cancel_event.is_set():
                 for temp_file in temp_files:
-                    if temp_file.exists():
-                        with open(temp_file, 'rb') as src:
-                            dest.write(src.read())
-                        # Clean up temp file
-                        temp_file.unlink()
+                    temp_file.unlink(missing_ok=True)
+                progress_queue.put({
+                    'type': 'cancelled',
+                    'message': 'Download cancelled'
+                })
+                return
+            
+            # Only a complete set of parts may become the final file
+            for (chunk_start, chunk_end), temp_file in zip(chunks, part_files):
+                expected = chunk_end - chunk_start + 1
+                if not temp_file.exists() or temp_file.stat().st_size != expected:
+                    raise DownloadError(f"Incomplete download: {temp_file.name} is missing or truncated")
+            
+            # Combine all chunks, streaming each one instead of reading it whole
+            with open(combined_path, 'wb') as dest:
+                for temp_file in part_files:
+                    with open(temp_file, 'rb') as src:
+                        shutil.copyfileobj(src, dest, FileDownloader.MIN_CHUNK_SIZE)
+                    # Clean up temp file
+                    temp_file.unlink()
+            os.replace(combined_path, dest_path)
             
             logger.info("Download completed successfully")
             progress_queue.put({'type': 'complete'})
@@ -140,8 +188,7 @@ class FileDownloader:
             progress_queue.put({'type': 'error', 'error': error_msg})
             # Clean up any temporary files
             for temp_file in temp_files:
-                if temp_file.exists():
-                    temp_file.unlink()
+                temp_file.unlink(missing_ok=True)
             raise DownloadError(error_msg)
     
     @staticmethod
@@ -154,6 +201,7 @@ class FileDownloader:
         with open(dest_path, 'wb') as f:
             downloaded = 0
             start_time = time.time()
+            last_post = 0.0
             
             for chunk in response.iter_content(chunk_size=FileDownloader.CHUNK_SIZE):
                 if cancel_event and cancel_event.is_set():
@@ -169,9 +217,13 @@ class FileDownloader:
                     f.write(chunk)
                     downloaded += len(chunk)
                     
-                    if total_size > 0:
+                    now = time.time()
+                    # Coalesce per-chunk updates; the final 100% is always sent
+                    if total_size > 0 and (now - last_post >= FileDownloader.PROGRESS_INTERVAL
+                                           or downloaded >= total_size):
+                        last_post = now
                         # Calculate speed and progress
-                        elapsed = time.time() - start_time
+                        elapsed = now - start_time
                         speed = downloaded / elapsed if elapsed > 0 else 0
                         
                         # Format values
@@ -207,11 +259,16 @@ class FileDownloader:
         cookies = {}
         chrome_error = None
         firefox_error = None
+        # Let the browser stores filter by site so only this site's cookies are
+        # read and decrypted instead of the whole jar. The last two host labels
+        # still cover cookies set for the parent domain (".example.com")
+        host = urlparse(url).hostname or ""
+        site = ".".join(host.split(".")[-2:])
 
         try:
             logger.debug("Attempting to get Chrome cookies")
             try:
-                chrome_cookies = browsercookie.chrome()
+                chrome_cookies = browsercookie.chrome(domain_name=site)
                 for cookie in chrome_cookies:
                     if cookie.domain in url:
                         cookies[cookie.name] = cookie.value
@@ -222,7 +279,7 @@ class FileDownloader:
                 
             logger.debug("Attempting to get Firefox cookies")
             try:
-                firefox_cookies = browsercookie.firefox()
+                firefox_cookies = browsercookie.firefox(domain_name=site)
                 firefox_count = 0
                 for cookie in firefox_cookies:
                     if cookie.domain in url:
@@ -247,12 +304,3 @@ class FileDownloader:
         except Exception as e:
             # Wrap any other unexpected errors
             raise BrowserCookieError(f"Unexpected error getting browser cookies: {str(e)}")
-        
-    @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """Format bytes into human readable size"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f} TB"
@@ -1,7 +1,6 @@
 import multiprocessing as mp
 from typing import Any, Callable, Optional, Dict
 import uuid
-import time
 
 from utils.logger import Logger
 from utils.exceptions import ProcessError
@@ -63,10 +62,9 @@ class ProcessPool:
             
     def get_process_status(self, process_id: str) -> str:
         """Get the status of a process"""
-        if process_id not in self.processes:
+        process = self.processes.get(process_id)
+        if process is None:
             return "not_found"
-            
-        process = self.processes[process_id]
         
         if process_id in self.errors:
             return "failed"
@@ -89,28 +87,35 @@ class ProcessPool:
         
     def terminate_process(self, process_id: str):
         """Terminate a running process"""
-        if process_id in self.processes:
+        # May run on a worker thread while the Tk thread uses the pool, so
+        # every dict access is a single get/pop rather than check-then-index
+        process = self.processes.get(process_id)
+        if process is not None:
             # Set cancel event
-            if process_id in self.cancel_events:
-                self.cancel_events[process_id].set()
+            cancel_event = self.cancel_events.get(process_id)
+            if cancel_event is not None:
+                cancel_event.set()
                 
-            # Wait a bit for graceful shutdown
-            time.sleep(0.5)
+            # Wait up to half a second for graceful shutdown, returning as
+            # soon as the process exits instead of always sleeping
+            process.join(timeout=0.5)
             
             # Force terminate if still running
-            process = self.processes[process_id]
             if process.is_alive():
                 process.terminate()
                 process.join()
                 
             # Clean up
-            if process_id in self.cancel_events:
-                del self.cancel_events[process_id]
+            self.cancel_events.pop(process_id, None)
                 
             logger.debug(f"Terminated process {process_id}")
             
     def cleanup(self):
         """Terminate all processes and cleanup"""
+        # Signal every process first so they shut down in parallel rather than
+        # each getting its own grace period in turn
+        for cancel_event in list(self.cancel_events.values()):
+            cancel_event.set()
         for process_id in list(self.processes.keys()):
             self.terminate_process(process_id)
         self.processes.clear()
@@ -128,6 +133,5 @@ class ProcessPool:
 
     def is_process_running(self, process_id: str) -> bool:
         """Check if a process is still running"""
-        if process_id not in self.processes:
-            return False
-        return self.processes[process_id].is_alive()
+        process = self.processes.get(process_id)
+        return process is not None and process.is_alive()
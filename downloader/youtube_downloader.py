@@ -6,7 +6,10 @@ import yt_dlp
 import json
 from multiprocessing import Queue, Process, Event
 import multiprocessing as mp
+import threading
+import time
 import uuid
+from collections import deque, OrderedDict
 from utils.exceptions import YouTubeError, FFmpegError, DownloadError
 from utils.logger import Logger
 import unicodedata
@@ -29,6 +32,16 @@ def clean_filename(filename: str) -> str:
     # Limit length to avoid potential issues
     return filename[:200]
 
+# Target audio bitrate (kbps) for each audio quality setting
+AUDIO_BITRATES = {
+    "High (opus)": 160,
+    "High (m4a)": 128,
+    "Medium (opus)": 128,
+    "Medium (m4a)": 96,
+    "Low (opus)": 96,
+    "Low (m4a)": 64
+}
+
 def get_video_info(url: str) -> Dict[str, Any]:
     """Get video information including available formats"""
     ydl_opts = {
@@ -54,119 +67,42 @@ def find_best_matching_resolution(formats: list, target_height: int) -> int:
     Find the best matching resolution from available formats, considering both higher and lower resolutions.
     Returns the height of the best matching format.
     """
-    # Extract all available heights from formats
-    available_heights = set()
-    for fmt in formats:
-        if fmt.get('height') and fmt.get('vcodec') != 'none':
-            available_heights.add(fmt['height'])
+    # Collect all available heights from formats in a single pass
+    available_heights = {
+        fmt['height'] for fmt in formats
+        if fmt.get('height') and fmt.get('vcodec') != 'none'
+    }
     
     if not available_heights:
         raise YouTubeError("No video formats found")
     
-    available_heights = sorted(list(available_heights))
-    
-    # If target is lower than minimum available, return minimum
-    if target_height <= available_heights[0]:
-        return available_heights[0]
-    
-    # If target is higher than maximum available, return maximum
-    if target_height >= available_heights[-1]:
-        return available_heights[-1]
-    
-    # Find the closest resolution using alternating higher/lower check
-    lower_idx = 0
-    higher_idx = 0
-    
-    # Find the first height that's higher than target
-    for i, height in enumerate(available_heights):
-        if height > target_height:
-            higher_idx = i
-            lower_idx = i - 1
-            break
-    
-    while lower_idx >= 0 or higher_idx < len(available_heights):
-        # Check lower resolution
-        if lower_idx >= 0:
-            lower_diff = target_height - available_heights[lower_idx]
-            lower_match = available_heights[lower_idx]
-        else:
-            lower_diff = float('inf')
-            
-        # Check higher resolution
-        if higher_idx < len(available_heights):
-            higher_diff = available_heights[higher_idx] - target_height
-            higher_match = available_heights[higher_idx]
-        else:
-            higher_diff = float('inf')
-            
-        # Return the closest match
-        if lower_diff <= higher_diff:
-            return lower_match
-        else:
-            return higher_match
-    
-    # Fallback to the closest available resolution
-    return min(available_heights, key=lambda x: abs(x - target_height))
+    # Closest height in one pass without sorting; on a tie the lower one wins
+    return min(available_heights, key=lambda height: (abs(height - target_height), height))
 
 def find_best_matching_audio_quality(formats: list, target_bitrate: int) -> Tuple[int, str]:
     """
     Find the best matching audio quality from available formats.
     Returns a tuple of (bitrate, codec) of the best matching format.
     """
-    # Extract all available audio formats with their bitrates
-    available_formats = []
-    for fmt in formats:
-        # Only consider audio formats
-        if fmt.get('acodec') != 'none' and fmt.get('abr'):
-            available_formats.append({
-                'abr': fmt['abr'],  # Average bitrate
-                'acodec': fmt['acodec'],
-                'ext': fmt.get('ext', '')
-            })
+    # Collect (bitrate, codec) pairs of all audio formats in a single pass
+    available_formats = [
+        (fmt['abr'], fmt['acodec']) for fmt in formats
+        if fmt.get('acodec') != 'none' and fmt.get('abr')
+    ]
     
     if not available_formats:
         raise YouTubeError("No audio formats found")
     
-    # Sort formats by bitrate
-    available_formats.sort(key=lambda x: x['abr'])
-    available_bitrates = [fmt['abr'] for fmt in available_formats]
-    
-    # If target is lower than minimum available, return minimum
-    if target_bitrate <= available_bitrates[0]:
-        best_format = available_formats[0]
-        logger.info(f"Selected minimum available audio quality: {best_format['abr']}k {best_format['acodec']}")
-        return best_format['abr'], best_format['acodec']
-    
-    # If target is higher than maximum available, return maximum
-    if target_bitrate >= available_bitrates[-1]:
-        best_format = available_formats[-1]
-        logger.info(f"Selected maximum available audio quality: {best_format['abr']}k {best_format['acodec']}")
-        return best_format['abr'], best_format['acodec']
-    
-    # Find the closest bitrate using alternating higher/lower check
-    lower_idx = 0
-    higher_idx = 0
+    # Closest bitrate in one pass without sorting; on a tie the lower one wins.
+    # yt-dlp lists formats worst to best, so scan backwards to prefer its pick
+    # among formats with the same bitrate
+    best_abr, best_acodec = min(
+        reversed(available_formats),
+        key=lambda abr_codec: (abs(abr_codec[0] - target_bitrate), abr_codec[0])
+    )
     
-    # Find the first bitrate that's higher than target
-    for i, bitrate in enumerate(available_bitrates):
-        if bitrate > target_bitrate:
-            higher_idx = i
-            lower_idx = i - 1
-            break
-    
-    # Check lower quality
-    lower_diff = float('inf') if lower_idx < 0 else target_bitrate - available_bitrates[lower_idx]
-    # Check higher quality
-    higher_diff = float('inf') if higher_idx >= len(available_bitrates) else available_bitrates[higher_idx] - target_bitrate
-    
-    # Select the closest match
-    if lower_diff <= higher_diff and lower_idx >= 0:
-        best_format = available_formats[lower_idx]
-    else:
-        best_format = available_formats[higher_idx]
-    
-    logger.info(f"Selected audio quality: {best_format['abr']}k {best_format['acodec']} (requested: {target_bitrate}k)")
-    return best_format['abr'], best_format['acodec']
+    logger.info(f"Selected audio quality: {best_abr}k {best_acodec} (requested: {target_bitrate}k)")
+    return best_abr, best_acodec
 
 def download_video(
     url: str,
@@ -197,14 +133,7 @@ def download_video(
             target_height = best_height
         
         # Get target audio bitrate from quality setting
-        target_bitrate = {
-            "High (opus)": 160,
-            "High (m4a)": 128,
-            "Medium (opus)": 128,
-            "Medium (m4a)": 96,
-            "Low (opus)": 96,
-            "Low (m4a)": 64
-        }.get(audio_quality, 128)  # Default to 128k if not found
+        target_bitrate = AUDIO_BITRATES.get(audio_quality, 128)  # Default to 128k if not found
         
         # Find best matching audio quality
         best_bitrate, best_codec = find_best_matching_audio_quality(info['formats'], target_bitrate)
@@ -298,6 +227,8 @@ class YouTubeDownloader:
         "Low (m4a)": ["599"]
     }
     
+    PROGRESS_INTERVAL = 0.1  # Post at most ~10 progress updates per second per stream
+    
     get_video_info = staticmethod(get_video_info)
     download_video = staticmethod(download_video)
     
@@ -307,23 +238,33 @@ class YouTubeDownloader:
         audio_path: str,
         output_path: str,
         progress_queue: Optional[Any] = None,
-        cancel_event: Event = None
+        cancel_event: Event = None,
+        duration: Optional[float] = None
     ):
-        """Mux video and audio files using ffmpeg"""
+        """Mux video and audio files using ffmpeg, probing the duration only if not given"""
         try:
             # Check if already cancelled
             if cancel_event and cancel_event.is_set():
                 logger.info("Muxing cancelled before starting")
                 return
                 
-            # Get total duration from file before starting
-            probe_cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', audio_path]
-            total_duration = float(subprocess.check_output(probe_cmd, universal_newlines=True).strip())
+            # Get total duration from file before starting, unless the caller
+            # already knows it (e.g. from yt-dlp's metadata)
+            if duration:
+                total_duration = float(duration)
+            else:
+                probe_cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', audio_path]
+                total_duration = float(subprocess.check_output(probe_cmd, universal_newlines=True).strip())
                 
-            # Prepare ffmpeg command
+            # Prepare ffmpeg command; only errors go to stderr and progress is
+            # written as key=value lines to stdout, so neither pipe grows unbounded
             ffmpeg_cmd = [
                 'ffmpeg',
                 '-y',  # Overwrite output file if exists
+                '-hide_banner',
+                '-loglevel', 'error',
+                '-nostats',
+                '-progress', 'pipe:1',
                 '-i', audio_path
             ]
             
@@ -348,6 +289,14 @@ class YouTubeDownloader:
                 universal_newlines=True
             )
             
+            # Drain stderr in the background, keeping only the tail for error reports
+            error_lines = deque(maxlen=20)
+            stderr_thread = threading.Thread(
+                target=lambda: error_lines.extend(process.stderr),
+                daemon=True
+            )
+            stderr_thread.start()
+            
             # Monitor process output
             while True:
                 # Check for cancellation
@@ -356,47 +305,46 @@ class YouTubeDownloader:
                     process.terminate()
                     process.wait(timeout=1)  # Wait for process to terminate
                     # Clean up output file if it exists
-                    if os.path.exists(output_path):
-                        os.remove(output_path)
+                    Path(output_path).unlink(missing_ok=True)
                     return
                     
-                # Read ffmpeg output
-                line = process.stderr.readline()
+                # Read ffmpeg progress output
+                line = process.stdout.readline()
                 if not line and process.poll() is not None:
                     break
                     
                 # Try to parse progress
-                if progress_queue and "time=" in line:
-                    try:
-                        time_str = line.split("time=")[1].split()[0]
-                        time_parts = time_str.split(":")
-                        seconds = float(time_parts[0]) * 3600 + float(time_parts[1]) * 60 + float(time_parts[2])
-                        
-                        # Calculate progress percentage
-                        progress = (seconds / total_duration) * 100 if total_duration > 0 else 0
-                        
-                        # Format time values in MB style for consistency
-                        current_mb = (seconds / total_duration) * 100 if total_duration > 0 else 0  # Use percentage as MB for visual consistency
-                        total_mb = 100  # Total is always 100 since we're showing percentage
-                        
-                        # Format status message with time and MB values
-                        status = f"{current_mb:.1f}MB/{total_mb:.1f}MB"
-                        
-                        progress_queue.put({
-                            'type': 'muxing_progress',
-                            'data': {
-                                'progress': progress,
-                                'status': status,
-                                'downloaded': f"{current_mb:.1f}MB",
-                                'total': f"{total_mb:.1f}MB"
-                            }
-                        })
-                    except Exception as e:
-                        logger.warning(f"Failed to parse time position: {str(e)}")
+                if progress_queue and line.startswith("out_time_us="):
+                    value = line.split("=", 1)[1].strip()
+                    if not value.isdigit():
+                        continue  # N/A until the first packet is written
+                    seconds = int(value) / 1_000_000
+                    
+                    # Calculate progress percentage
+                    progress = (seconds / total_duration) * 100 if total_duration > 0 else 0
+                    
+                    # Format time values in MB style for consistency
+                    current_mb = progress  # Use percentage as MB for visual consistency
+                    total_mb = 100  # Total is always 100 since we're showing percentage
+                    
+                    # Format status message with time and MB values
+                    status = f"{current_mb:.1f}MB/{total_mb:.1f}MB"
+                    
+                    progress_queue.put({
+                        'type': 'muxing_progress',
+                        'data': {
+                            'progress': progress,
+                            'status': status,
+                            'downloaded': f"{current_mb:.1f}MB",
+                            'total': f"{total_mb:.1f}MB"
+                        }
+                    })
                         
             # Check process return code
+            process.wait()
+            stderr_thread.join(timeout=1)
             if process.returncode != 0:
-                error_output = process.stderr.read()
+                error_output = "".join(error_lines)
                 logger.error(f"FFmpeg failed with error: {error_output}", exc_info=True)
                 raise FFmpegError(f"FFmpeg failed with error: {error_output}")
             else:
@@ -410,24 +358,57 @@ class YouTubeDownloader:
         except Exception as e:
             logger.error(f"Error during muxing: {str(e)}", exc_info=True)
             # Clean up output file if it exists
-            if os.path.exists(output_path):
-                os.remove(output_path)
+            Path(output_path).unlink(missing_ok=True)
             raise
     
+    # Options for the long-lived playlist extractor
+    PLAYLIST_OPTIONS = {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': 'in_playlist',
+        'flat_playlist': True,
+        'ignoreerrors': True,  # Skip unavailable videos
+        'no_color': True
+    }
+    
+    _playlist_ydl: Optional[yt_dlp.YoutubeDL] = None
+    _playlist_ydl_lock = threading.Lock()
+    
+    # Extracted playlist URLs by playlist URL, reused for a few minutes
+    PLAYLIST_CACHE_TTL = 300  # seconds
+    PLAYLIST_CACHE_SIZE = 32  # entries
+    # Oldest insert first, so expired entries are always at the front
+    _playlist_cache: Dict[str, Tuple[float, list]] = OrderedDict()
+    
+    @staticmethod
+    def _cache_playlist(url: str, urls: list):
+        """Store extracted playlist URLs, evicting expired and excess entries"""
+        cache = YouTubeDownloader._playlist_cache
+        now = time.monotonic()
+        cache[url] = (now, urls)
+        cache.move_to_end(url)
+        while cache:
+            stored_at, _ = next(iter(cache.values()))
+            if (now - stored_at < YouTubeDownloader.PLAYLIST_CACHE_TTL
+                    and len(cache) <= YouTubeDownloader.PLAYLIST_CACHE_SIZE):
+                break
+            cache.popitem(last=False)
+        
     @staticmethod
     def get_playlist_urls(url: str) -> list[str]:
         """Get all video URLs from a playlist"""
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': 'in_playlist',
-            'flat_playlist': True,
-            'ignoreerrors': True,  # Skip unavailable videos
-            'no_color': True
-        }
-        
         logger.debug(f"Getting playlist URLs from: {url}")
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        # YoutubeDL is not thread-safe, so the shared instance is used under a lock
+        with YouTubeDownloader._playlist_ydl_lock:
+            cached = YouTubeDownloader._playlist_cache.get(url)
+            if cached and time.monotonic() - cached[0] < YouTubeDownloader.PLAYLIST_CACHE_TTL:
+                logger.debug(f"Using cached playlist URLs for: {url}")
+                return list(cached[1])
+                
+            if YouTubeDownloader._playlist_ydl is None:
+                # Built once per process; extractor setup is too costly to repeat per playlist
+                YouTubeDownloader._playlist_ydl = yt_dlp.YoutubeDL(YouTubeDownloader.PLAYLIST_OPTIONS)
+            ydl = YouTubeDownloader._playlist_ydl
             try:
                 info = ydl.extract_info(url, download=False)
                 logger.debug(f"Playlist info: {info.keys()}")
@@ -442,7 +423,8 @@ class YouTubeDownloader:
                             urls.append(video_url)
                     
                     logger.debug(f"Found {len(urls)} videos in playlist")
-                    return urls
+                    YouTubeDownloader._cache_playlist(url, urls)
+                    return list(urls)
                 else:
                     # Not a playlist, return empty list
                     logger.debug("No entries found in playlist info")
@@ -480,22 +462,43 @@ class YouTubeDownloader:
                 logger.error(f"Error in progress hook: {str(e)}", exc_info=True)
                 
     @staticmethod
-    def download_stream(url: str, options: dict, stream_type: str, progress_queue: Any, cancel_event: Event):
-        """Download a single stream (video or audio)"""
+    def download_stream(
+        url: str,
+        options: dict,
+        stream_type: str,
+        progress_queue: Any,
+        cancel_event: Event,
+        info: Optional[Dict[str, Any]] = None
+    ):
+        """Download a single stream (video or audio), reusing already extracted info if given"""
         try:
             logger.info(f"Starting {stream_type} download for {url}")
             logger.debug(f"{stream_type.title()} download options: {options}")
             
+            last_post = [0.0]  # Time of the last progress update sent to the UI
+            
             # Create a custom progress hook that checks for cancellation
             def progress_hook(d):
                 if cancel_event.is_set():
                     raise Exception("Download cancelled")
+                now = time.monotonic()
+                # yt-dlp calls this for every received block; skip formatting and
+                # queueing most of them, the final 100% is always sent
+                if (now - last_post[0] < YouTubeDownloader.PROGRESS_INTERVAL
+                        and d.get('downloaded_bytes') != d.get('total_bytes')):
+                    return
+                last_post[0] = now
                 YouTubeDownloader.stream_progress_hook(d, stream_type, progress_queue)
                 
             options['progress_hooks'] = [progress_hook]
             
             with yt_dlp.YoutubeDL(options) as ydl:
-                ydl.download([url])
+                if info is not None:
+                    # Select and download formats from the parent's extraction
+                    # instead of fetching and parsing the video page again
+                    ydl.process_ie_result(info, download=True)
+                else:
+                    ydl.download([url])
                 
             logger.info(f"Finished {stream_type} download")
             
@@ -525,12 +528,18 @@ class YouTubeDownloader:
         cancel_event: Event
     ):
         """Standalone process for downloading YouTube videos"""
+        video_temp = audio_temp = None  # Temp files removed again on failure
         try:
             logger.info(f"Starting YouTube download process for {url}")
             
             # Get video info
             with yt_dlp.YoutubeDL() as ydl:
                 info = ydl.extract_info(url, download=False)
+            # Plain-data copy that can be pickled into the stream processes. The
+            # requested_formats/requested_downloads of the default format pick
+            # must go, otherwise every stream would download and merge that
+            # pair instead of running its own format selection
+            info = yt_dlp.YoutubeDL.sanitize_info(info, remove_private_keys=True)
                 
             # Send title to progress queue immediately
             title = info.get('title', url)
@@ -543,10 +552,6 @@ class YouTubeDownloader:
             temp_dir = Path(download_folder) / ".temp"
             temp_dir.mkdir(exist_ok=True)
             
-            # Set up queues for progress monitoring
-            video_queue = mp.Queue() if not audio_only else None
-            audio_queue = mp.Queue()
-            
             # Create unique temp filenames
             video_temp = None if audio_only else temp_dir / f"video_{uuid.uuid4()}.mp4"
             audio_temp = temp_dir / f"audio_{uuid.uuid4()}.m4a"
@@ -571,44 +576,42 @@ class YouTubeDownloader:
                 'no_warnings': True
             }
             
-            # Start processes list
-            processes = []
-            
-            # Start audio download
-            audio_process = Process(
-                target=YouTubeDownloader.download_stream,
-                args=(url, audio_opts, 'audio', progress_queue, cancel_event)
-            )
-            audio_process.start()
-            processes.append(audio_process)
-            
-            # Start video download if needed
-            if video_opts:
-                video_process = Process(
-                    target=YouTubeDownloader.download_stream,
-                    args=(url, video_opts, 'video', progress_queue, cancel_event)
-                )
-                video_process.start()
-                processes.append(video_process)
-                
-            # Wait for downloads to complete
-            for process in processes:
-                process.join()
-                if process.exitcode != 0:
-                    # Clean up temp files
-                    if video_temp and video_temp.exists():
-                        video_temp.unlink()
-                    if audio_temp.exists():
-                        audio_temp.unlink()
-                    return  # Exit early if any process failed
+            if audio_only:
+                # A single stream gains nothing from a second process, so
+                # download it right here instead of spawning one
+                try:
+                    YouTubeDownloader.download_stream(url, audio_opts, 'audio', progress_queue, cancel_event, info)
+                except DownloadError:
+                    # download_stream already reported the error
+                    audio_temp.unlink(missing_ok=True)
+                    return
+            else:
+                # Download video and audio in parallel, one process per stream
+                processes = []
+                for stream_type, opts in (('audio', audio_opts), ('video', video_opts)):
+                    process = Process(
+                        target=YouTubeDownloader.download_stream,
+                        args=(url, opts, stream_type, progress_queue, cancel_event, info)
+                    )
+                    process.start()
+                    processes.append(process)
+                    
+                # Wait for downloads to complete
+                for process in processes:
+                    process.join()
+                    if process.exitcode != 0:
+                        # Clean up temp files
+                        if video_temp:
+                            video_temp.unlink(missing_ok=True)
+                        audio_temp.unlink(missing_ok=True)
+                        return  # Exit early if any process failed
                     
             # Check for cancellation before muxing
             if cancel_event.is_set():
                 # Clean up temp files
-                if video_temp and video_temp.exists():
-                    video_temp.unlink()
-                if audio_temp.exists():
-                    audio_temp.unlink()
+                if video_temp:
+                    video_temp.unlink(missing_ok=True)
+                audio_temp.unlink(missing_ok=True)
                 progress_queue.put({
                     'type': 'cancelled',
                     'message': 'Download cancelled'
@@ -626,7 +629,10 @@ class YouTubeDownloader:
             if not audio_only:
                 logger.info(f"Merging files to: {output_path}")
                 try:
-                    YouTubeDownloader.mux_files(video_temp, audio_temp, str(output_path), progress_queue, cancel_event)
+                    YouTubeDownloader.mux_files(
+                        video_temp, audio_temp, str(output_path), progress_queue, cancel_event,
+                        duration=info.get('duration')
+                    )
                 except Exception as e:
                     if str(e) == "Muxing cancelled":
                         progress_queue.put({
@@ -637,10 +643,9 @@ class YouTubeDownloader:
                         raise
                 finally:
                     # Clean up temp files
-                    if video_temp and video_temp.exists():
-                        video_temp.unlink()
-                    if audio_temp.exists():
-                        audio_temp.unlink()
+                    if video_temp:
+                        video_temp.unlink(missing_ok=True)
+                    audio_temp.unlink(missing_ok=True)
             else:
                 # For audio only, just rename the temp file
                 os.rename(audio_temp, str(output_path))
@@ -663,10 +668,10 @@ class YouTubeDownloader:
                 })
             
             # Clean up temp files
-            if 'video_temp' in locals() and video_temp and video_temp.exists():
-                video_temp.unlink()
-            if 'audio_temp' in locals() and audio_temp and audio_temp.exists():
-                audio_temp.unlink()
+            if video_temp:
+                video_temp.unlink(missing_ok=True)
+            if audio_temp:
+                audio_temp.unlink(missing_ok=True)
     
     @staticmethod
     def monitor_progress(progress_queue: Any, video_queue: Any = None, audio_queue: Any = None, cancel_event: Event = None) -> None:
@@ -1,6 +1,5 @@
 import sys
 from pathlib import Path
-import customtkinter as ctk
 from utils.logger import Logger
 from ui.main_window import MainWindow
 
@@ -11,12 +10,7 @@ def main():
     try:
         logger.info("=== Starting JustDownloadIt ===")
         
-        # Initialize customtkinter
-        logger.debug("Initializing customtkinter")
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("blue")
-        
-        # Create and run main window
+        # Create and run main window (it applies the customtkinter theme itself)
         logger.info("Creating main window")
         window = MainWindow()
         logger.info("Starting main event loop")
@@ -1,13 +1,82 @@
 import customtkinter as ctk
 import tkinter as tk  # Import tkinter for Canvas
-import uuid
+import itertools
 from typing import Callable, Optional
 from utils.logger import Logger
 from utils.exceptions import JustDownloadItError
 
 logger = Logger.get_logger(__name__)
 
+class _ProgressRow:
+    """A captioned progress bar with a detail label, one per download phase"""
+    __slots__ = ('frame', 'bar', 'label', 'visible', 'text', 'transfer')
+    
+    # Smallest bar change worth a redraw; 0.5% is about one pixel of the default bar width
+    MIN_STEP = 0.005
+    
+    def __init__(self, master, caption: str, row: int):
+        self.frame = ctk.CTkFrame(master)
+        
+        ctk.CTkLabel(self.frame, text=caption, width=50).pack(side="left", padx=5)
+        
+        self.bar = ctk.CTkProgressBar(self.frame)
+        self.bar.pack(side="left", fill="x", expand=True, padx=5)
+        self.bar.set(0)
+        
+        self.label = ctk.CTkLabel(self.frame, text="", width=150)
+        self.label.pack(side="left", padx=5)
+        
+        # Rows start hidden in a fixed grid row; grid_remove() keeps the grid
+        # options, so showing a row again restores it in place and in order
+        self.frame.grid(row=row, column=0, sticky="ew", pady=2)
+        self.frame.grid_remove()
+        
+        # Remembering visibility and text lets repeated updates skip the
+        # geometry manager and label reconfigures entirely
+        self.visible = False
+        self.text = ""
+        self.transfer = None  # Last (downloaded, total, speed) shown
+        
+    def show(self):
+        """Show the row unless it is already shown"""
+        if not self.visible:
+            self.frame.grid()
+            self.visible = True
+            
+    def hide(self):
+        """Hide the row if it is shown"""
+        if self.visible:
+            self.frame.grid_remove()
+            self.visible = False
+            
+    def set_progress(self, progress: float):
+        """Set the bar from a percentage, skipping redraws for unchanged values"""
+        value = min(1.0, progress / 100)
+        current = self.bar.get()
+        # Sub-pixel changes are invisible, but always let the bar reach 100%
+        if abs(value - current) >= self.MIN_STEP or (value >= 1.0 and current < 1.0):
+            self.bar.set(value)
+            
+    def set_transfer(self, downloaded: str, total: str, speed: str):
+        """Show transfer details, formatting the text only when a value changed"""
+        transfer = (downloaded, total, speed)
+        if transfer != self.transfer:
+            self.transfer = transfer
+            self.set_text(f"{downloaded}/{total} ({speed})")
+            
+    def set_text(self, text: str):
+        """Set the detail label only when the text differs"""
+        if text != self.text:
+            self.label.configure(text=text)
+            self.text = text
+
+
 class DownloadWidget(ctk.CTkFrame):
+    # Title font shared by all download widgets, created on first use
+    _title_font: Optional[ctk.CTkFont] = None
+    # Source of widget IDs; they only need to be unique within this process
+    _ids = itertools.count(1)
+    
     def __init__(
         self,
         master,
@@ -21,82 +90,49 @@ class DownloadWidget(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         
         self.url = url
-        self.id = str(uuid.uuid4())  # Generate unique ID for this widget
+        self.id = f"download_{next(DownloadWidget._ids)}"  # Generate unique ID for this widget
         self.process_id = None  # Store process ID for cancellation
         self.is_cancelled = False
         self.is_completed = False  # Initialize is_completed attribute
         self.on_cancel = on_cancel
         self.on_clear = on_clear
         self.is_destroyed = False  # Track if widget is destroyed
+        self.is_muxing = False  # Set once the muxing phase starts
         
         # Create main content frame
         content = ctk.CTkFrame(self)
         content.pack(fill="x", padx=5, pady=2)
         
         # Title
+        if DownloadWidget._title_font is None:
+            DownloadWidget._title_font = ctk.CTkFont(family="", size=12, weight="bold")
         self.title_label = ctk.CTkLabel(
             content,
             text=title,
             anchor="w",
-            font=("", 12, "bold")
+            font=DownloadWidget._title_font
         )
         self.title_label.pack(fill="x", padx=5, pady=(2,0))
         
         # Progress section
         self.progress_frame = ctk.CTkFrame(content)
         self.progress_frame.pack(fill="x", pady=(2,0))
+        self._progress_hidden = False  # Set while queued
         
-        # Video progress
-        self.video_frame = ctk.CTkFrame(self.progress_frame)
-        self.video_frame.pack(fill="x", pady=2)
-        
-        ctk.CTkLabel(self.video_frame, text="Video:", width=50).pack(side="left", padx=5)
-        
-        self.video_progress = ctk.CTkProgressBar(self.video_frame)
-        self.video_progress.pack(side="left", fill="x", expand=True, padx=5)
-        self.video_progress.set(0)
-        
-        self.video_label = ctk.CTkLabel(self.video_frame, text="", width=150)
-        self.video_label.pack(side="left", padx=5)
-        
-        # Audio progress
-        self.audio_frame = ctk.CTkFrame(self.progress_frame)
-        self.audio_frame.pack(fill="x", pady=2)
-        
-        ctk.CTkLabel(self.audio_frame, text="Audio:", width=50).pack(side="left", padx=5)
-        
-        self.audio_progress = ctk.CTkProgressBar(self.audio_frame)
-        self.audio_progress.pack(side="left", fill="x", expand=True, padx=5)
-        self.audio_progress.set(0)
-        
-        self.audio_label = ctk.CTkLabel(self.audio_frame, text="", width=150)
-        self.audio_label.pack(side="left", padx=5)
-        
-        # Muxing progress
-        self.muxing_frame = ctk.CTkFrame(self.progress_frame)
-        self.muxing_frame.pack(fill="x", pady=2)  # Pack initially so it's properly configured
-        
-        ctk.CTkLabel(self.muxing_frame, text="Muxing:", width=50).pack(side="left", padx=5)
-        
-        self.muxing_progress = ctk.CTkProgressBar(self.muxing_frame)
-        self.muxing_progress.pack(side="left", fill="x", expand=True, padx=5)
-        self.muxing_progress.set(0)
-        
-        self.muxing_label = ctk.CTkLabel(self.muxing_frame, text="", width=150)
-        self.muxing_label.pack(side="left", padx=5)
-        
-        # Hide progress bars initially
-        self.video_frame.pack_forget()
-        self.audio_frame.pack_forget()
-        self.muxing_frame.pack_forget()
+        # Progress rows, shown as the download reaches each phase
+        self.progress_frame.grid_columnconfigure(0, weight=1)
+        self.video_row = _ProgressRow(self.progress_frame, "Video:", 0)
+        self.audio_row = _ProgressRow(self.progress_frame, "Audio:", 1)
+        self.muxing_row = _ProgressRow(self.progress_frame, "Muxing:", 2)
         
         # Status and cancel
         status_frame = ctk.CTkFrame(content)
         status_frame.pack(fill="x", pady=(2,2))
         
+        self._status_text = "Starting download..."
         self.status_label = ctk.CTkLabel(
             status_frame,
-            text="Starting download...",
+            text=self._status_text,
             anchor="w"
         )
         self.status_label.pack(side="left", padx=5)
@@ -108,69 +144,137 @@ class DownloadWidget(ctk.CTkFrame):
             command=self._on_button_click
         )
         self.cancel_btn.pack(side="right", padx=5)
+        self._shows_clear = False  # Cancel button already turned into "Clear"
         
         logger.debug(f"Download widget created with URL: {self.url}")
         
     def show_video_progress(self):
         """Show video progress bar"""
         if not self.is_destroyed:
-            self.video_frame.pack(fill="x", pady=2)
+            self.video_row.show()
             
     def show_audio_progress(self):
         """Show audio progress bar"""
         if not self.is_destroyed:
-            self.audio_frame.pack(fill="x", pady=2)
+            self.audio_row.show()
             
     def show_muxing_progress(self):
         """Show muxing progress bar and hide video/audio progress"""
         if not self.is_destroyed:
             # Hide video and audio frames
-            self.video_frame.pack_forget()
-            self.audio_frame.pack_forget()
+            self.video_row.hide()
+            self.audio_row.hide()
             
             # Show muxing frame within the progress frame
-            self.muxing_frame.pack(fill="x", pady=2)
-            self.progress_frame.update()  # Force update to ensure proper layout
+            self.muxing_row.show()
             
     def update_video_progress(self, progress: float, speed: str = "", downloaded: str = "", total: str = ""):
         """Update video download progress"""
-        if not self.is_destroyed and self.winfo_exists():
+        if not self.is_destroyed:
             try:
                 # Progress is already a percentage (0-100), convert to 0-1 for progress bar
-                self.video_progress.set(min(1.0, progress / 100))
+                self.video_row.set_progress(progress)
                 if speed and downloaded and total:
-                    self.video_label.configure(text=f"{downloaded}/{total} ({speed})")
+                    self.video_row.set_transfer(downloaded, total, speed)
             except Exception as e:
                 logger.error(f"Error updating video progress: {str(e)}", exc_info=True)
                 raise JustDownloadItError(f"Error updating video progress: {str(e)}")
             
     def update_audio_progress(self, progress: float, speed: str = "", downloaded: str = "", total: str = ""):
         """Update audio download progress"""
-        if not self.is_destroyed and self.winfo_exists():
+        if not self.is_destroyed:
             try:
                 # Progress is already a percentage (0-100), convert to 0-1 for progress bar
-                self.audio_progress.set(min(1.0, progress / 100))
+                self.audio_row.set_progress(progress)
                 if speed and downloaded and total:
-                    self.audio_label.configure(text=f"{downloaded}/{total} ({speed})")
+                    self.audio_row.set_transfer(downloaded, total, speed)
             except Exception as e:
                 logger.error(f"Error updating audio progress: {str(e)}", exc_info=True)
                 raise JustDownloadItError(f"Error updating audio progress: {str(e)}")
             
     def update_muxing_progress(self, progress: float, status: str = ""):
         """Update muxing progress"""
-        if not self.is_destroyed and self.winfo_exists():
+        if not self.is_destroyed:
             try:
                 # Progress is already a percentage (0-100), convert to 0-1 for progress bar
-                self.muxing_progress.set(min(1.0, progress / 100))
+                self.muxing_row.set_progress(progress)
                 if status:
-                    self.muxing_label.configure(text=status)
+                    self.muxing_row.set_text(status)
             except Exception as e:
                 logger.error(f"Error updating muxing progress: {str(e)}", exc_info=True)
                 raise JustDownloadItError(f"Error updating muxing progress: {str(e)}")
             
+    def update_progress(self, progress: dict) -> bool:
+        """Apply a progress message from a download monitor, returns True once the download has ended"""
+        if self.is_completed:
+            # Already finished; a late message (e.g. the cancel path's
+            # 'cancelled' after 'complete') must not finish it again
+            return False
+        msg_type = progress['type']
+        data = progress.get('data', {})
+        
+        if msg_type == 'start':
+            self.show_progress_frame()  # Hidden while the download was queued
+            self.show_audio_progress()  # Always show audio progress
+            if progress.get('has_video'):
+                self.show_video_progress()
+            if 'message' in progress:
+                self.set_status(progress['message'])
+        elif msg_type == 'title':
+            self.update_title(progress['title'])
+        elif msg_type == 'video_progress':
+            self.update_video_progress(
+                data.get('progress', 0),
+                data.get('speed', '0MB/s'),
+                data.get('downloaded', '0MB'),
+                data.get('total', '0MB')
+            )
+        elif msg_type in ('audio_progress', 'progress'):
+            # Regular file downloads report on the audio bar
+            self.update_audio_progress(
+                data.get('progress', 0),
+                data.get('speed', '0MB/s'),
+                data.get('downloaded', '0MB'),
+                data.get('total', '0MB')
+            )
+        elif msg_type == 'muxing_progress':
+            if not self.is_muxing:
+                # Switch layout and status once when muxing starts
+                self.is_muxing = True
+                self.show_muxing_progress()
+                self.set_status("Muxing video and audio...")
+            self.update_muxing_progress(
+                data.get('progress', 0),
+                data.get('status', 'Muxing...')
+            )
+        elif msg_type == 'status':
+            self.set_status(progress['message'])
+        elif msg_type == 'error':
+            self._finish(f"Error: {progress['error']}")
+            return True
+        elif msg_type == 'cancelled':
+            self._finish("Download cancelled")
+            return True
+        elif msg_type == 'complete':
+            self._finish(progress.get('message', 'Finished!'))
+            return True
+        elif msg_type == 'failed':
+            # A process stopped by the cancel button also ends without a message
+            self._finish("Download cancelled" if self.is_cancelled else "Download failed")
+            return True
+        return False
+        
+    def _finish(self, status: str):
+        """Show the final status and turn the cancel button into a clear button"""
+        self.is_completed = True
+        self.is_cancelled = True
+        if not self.is_destroyed:
+            self.set_status(status)
+            self.show_clear_button()
+            
     def update_title(self, title: str):
         """Update the widget's title"""
-        if not self.is_destroyed and self.winfo_exists():
+        if not self.is_destroyed:
             try:
                 self.title_label.configure(text=title)
             except Exception as e:
@@ -179,34 +283,50 @@ class DownloadWidget(ctk.CTkFrame):
             
     def set_status(self, status: str):
         """Update status text"""
-        if not self.is_destroyed and self.winfo_exists():
+        if not self.is_destroyed:
             try:
-                self.status_label.configure(text=status)
+                # Compare against the last text we set instead of asking Tk
+                if status != self._status_text:
+                    self.status_label.configure(text=status)
+                    self._status_text = status
                 if status.startswith("Error:"):
                     self.is_cancelled = True
-                    self.cancel_btn.configure(text="Clear")
+                    self.show_clear_button()
             except Exception as e:
                 logger.error(f"Error setting status: {str(e)}", exc_info=True)
                 raise JustDownloadItError(f"Error setting status: {str(e)}")
             
+    def show_clear_button(self):
+        """Turn the cancel button into a clear button, reconfiguring it only once"""
+        if not self._shows_clear and not self.is_destroyed:
+            self.cancel_btn.configure(text="Clear")
+            self._shows_clear = True
+            
     def hide_progress_frame(self):
         """Hide the entire progress section"""
-        if not self.is_destroyed and self.winfo_exists():
-            self.video_frame.pack_forget()
-            self.audio_frame.pack_forget()
-            self.muxing_frame.pack_forget()
+        if not self.is_destroyed:
+            self.video_row.hide()
+            self.audio_row.hide()
+            self.muxing_row.hide()
             self.progress_frame.pack_forget()
+            self._progress_hidden = True
+            
+    def show_progress_frame(self):
+        """Show the progress section again, e.g. when a queued download starts"""
+        if self._progress_hidden and not self.is_destroyed:
+            self.progress_frame.pack(fill="x", pady=(2,0), after=self.title_label)
+            self._progress_hidden = False
             
     def _on_button_click(self):
         """Handle button click based on current state"""
-        if not self.is_destroyed and self.winfo_exists():
+        if not self.is_destroyed:
             try:
                 if not self.is_cancelled:
                     # Cancel the download
                     if self.on_cancel:
-                        self.on_cancel()
+                        self.on_cancel(self.id)
                     self.is_cancelled = True
-                    self.cancel_btn.configure(text="Clear")
+                    self.show_clear_button()
                 else:
                     # Clear the widget
                     if self.on_clear:
@@ -217,6 +337,8 @@ class DownloadWidget(ctk.CTkFrame):
                 
     def destroy(self):
         """Override destroy to mark widget as destroyed"""
+        # Also runs when a parent is destroyed, so is_destroyed can stand in
+        # for asking Tk via winfo_exists() on every update
         self.is_destroyed = True
         super().destroy()
 
@@ -229,6 +351,6 @@ class DownloadWidget(ctk.CTkFrame):
         else:
             # Cancel the download
             self.is_cancelled = True
-            self.cancel_btn.configure(text="Clear")
+            self.show_clear_button()
             if self.on_cancel:
                 self.on_cancel(self.id)
@@ -10,6 +10,7 @@ import tkinter.messagebox as messagebox
 from tkinter import Tk
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
 from utils.exceptions import DownloadError, YouTubeError, ProcessError, FFmpegError, JustDownloadItError
 from utils.logger import Logger
 from .settings_panel import SettingsPanel
@@ -19,7 +20,8 @@ from downloader.file_downloader import FileDownloader
 from downloader.youtube_downloader import YouTubeDownloader
 from utils import ensure_unique_path
 from utils.utils_ui import is_youtube_url, get_filename_from_url
-import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 logger = Logger.get_logger(__name__)
 
@@ -29,8 +31,6 @@ class ResizerFrame(ctk.CTkFrame):
         self.resized_widget = resized_widget
         self.start_y = None
         self.initial_height = None
-        self.last_widget_height = None
-        self.initial_window_height = None
         self.current_height = 125  # Track the actual height we set
         
         # Scale factor to reduce movement (1/1.25)
@@ -47,14 +47,10 @@ class ResizerFrame(ctk.CTkFrame):
         self.bind("<B1-Motion>", self._on_drag)
         self.bind("<ButtonRelease-1>", self._on_release)
         
-        # For smoother updates
-        self._update_after_id = None
-        
     def _on_press(self, event):
         self.start_y = event.y_root
         # Use our tracked height instead of winfo_height
         self.initial_height = self.current_height
-        self.initial_window_height = self.winfo_toplevel().winfo_height()
 
     def _on_drag(self, event):
         if self.start_y is None:
@@ -67,38 +63,41 @@ class ResizerFrame(ctk.CTkFrame):
         scaled_delta = int(delta * self.scaling)
         new_height = max(50, self.initial_height + scaled_delta)
         
-        # Update URL field height and track it
+        # Update URL field height and track it; Tk lays it out once when idle
+        # instead of synchronously on every motion event
         self.current_height = new_height
         self.resized_widget.configure(height=new_height)
-        self.resized_widget.update_idletasks()
         
     def _on_release(self, event):
         if self.start_y is None:
             return
             
-        # Cancel any pending updates
-        if self._update_after_id:
-            self.after_cancel(self._update_after_id)
-            
         # Reset everything
         self.start_y = None
         self.initial_height = None
-        self.last_delta = 0
-        
-        # Re-enable and update settings panel
-        main_window = self.winfo_toplevel()
-        if hasattr(main_window, 'settings_panel'):
-            main_window.settings_panel.pack(fill="x", padx=10, pady=5)
-            self._update_layout()
-            
-    def _update_layout(self):
-        """Update layout with less flickering"""
-        self._update_after_id = None
-        main_window = self.winfo_toplevel()
-        if hasattr(main_window, 'settings_panel'):
-            main_window.update_idletasks()
             
 class MainWindow:
+    # Number of URLs validated at the same time, raised to the download limit
+    VALIDATION_WORKERS = 5
+    # Pooled connections per host in the shared HTTP session; also caps the
+    # validation workers so none of them waits on or discards a connection
+    MAX_VALIDATION_CONNECTIONS = 10
+    # Delay after the last edit before the URL box is re-scanned (ms)
+    URL_CHECK_DELAY = 150
+    # Progress messages where only the newest per widget needs to be drawn
+    COALESCED_MESSAGES = frozenset(('progress', 'video_progress', 'audio_progress', 'muxing_progress'))
+    # Download button options that differ between its two modes
+    DOWNLOAD_BUTTON_STYLE = {
+        'text': "Start Downloads",
+        'fg_color': "#2ea043",  # GitHub-style green
+        'hover_color': "#2c974b"  # Darker green for hover
+    }
+    PLAYLIST_BUTTON_STYLE = {
+        'text': "Extract Playlists",
+        'fg_color': "#d29922",  # Warm yellow for playlists
+        'hover_color': "#bf8700"  # Darker yellow for hover
+    }
+    
     def __init__(self):
         try:
             logger.info("Initializing main window")
@@ -113,7 +112,10 @@ class MainWindow:
             self.root = ctk.CTk()
             self.root.title("JustDownloadIt")
             self.root.geometry("600x800")
-            self.root.update_idletasks()  # Force geometry update
+            
+            # Named fonts shared by several widgets, so Tk resolves each only once
+            self.button_font = ctk.CTkFont(family="", size=13, weight="bold")
+            self.status_font = ctk.CTkFont(size=16, weight="bold")
             
             # Create main frame with 3 sections
             logger.debug("Creating main frame")
@@ -134,8 +136,9 @@ class MainWindow:
             text_container.pack(fill="x", pady=(5,0))
             text_container.pack_propagate(False)  # Prevent propagation of size changes
             
-            # Create the text box with explicit height
-            self.url_text = ctk.CTkTextbox(text_container, height=125)
+            # Create the text box with explicit height; one URL per line, so skip
+            # wrap reflow (long URLs scroll horizontally) and keep undo off
+            self.url_text = ctk.CTkTextbox(text_container, height=125, wrap="none", undo=False)
             self.url_text.pack(fill="both", expand=True)
             
             # Set container height to match textbox
@@ -146,6 +149,9 @@ class MainWindow:
             self.resizer.pack(fill="x", pady=(2,5))
             
             # Bind text change event to update button text
+            self._url_check_after_id = None
+            self._has_playlists = False  # Button starts in "Start Downloads" mode
+            self._url_text_seen = ""  # URL box content at the last mode check
             self.url_text.bind('<<Modified>>', self._on_url_text_changed)
             
             # 2. Settings panel (middle section)
@@ -163,20 +169,29 @@ class MainWindow:
             self.process_pool = ProcessPool(max_processes=int(self.settings_panel.max_downloads_var.get()))
             self.download_threads = self.settings_panel.thread_var.get()
             
+            # Shared HTTP session for URL validation, so checks against the same
+            # host reuse pooled connections instead of a new handshake per URL
+            self.http_session = requests.Session()
+            self.http_session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            })
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.MAX_VALIDATION_CONNECTIONS)
+            self.http_session.mount('http://', adapter)
+            self.http_session.mount('https://', adapter)
+            
             # Track active and pending downloads
             self.active_downloads = set()
-            self.pending_downloads = []  # List of (widget_id, url, settings) tuples
+            # Queued downloads in arrival order: widget_id -> (url, settings)
+            self.pending_downloads: Dict[str, tuple] = {}
             
             # Download button
             logger.debug("Creating download button")
             self.download_btn = ctk.CTkButton(
                 main_frame,
-                text="Start Downloads",
                 command=self._start_downloads,
-                fg_color="#2ea043",  # GitHub-style green
-                hover_color="#2c974b",  # Darker green for hover
                 text_color="black",
-                font=("", 13, "bold")
+                font=self.button_font,
+                **self.DOWNLOAD_BUTTON_STYLE
             )
             self.download_btn.pack(fill="x", padx=10, pady=10)
             
@@ -238,10 +253,13 @@ class MainWindow:
             # Store active downloads
             self.downloads: Dict[str, DownloadWidget] = {}
             
-            # Progress update queue
+            # Progress update queue; deque append/popleft are atomic, so monitor
+            # threads and the Tk thread share it without queue.Queue's locking
             logger.debug("Creating progress update queue")
-            self.progress_queue = queue.Queue()
-            self._start_progress_thread()
+            self.progress_queue = deque()
+            self._closing = False  # Set once the window starts shutting down
+            # Start polling once the window has been laid out and mapped
+            self.root.after_idle(self._start_progress_thread)
             
             # Add status labels at the bottom
             status_container = ctk.CTkFrame(self.root, fg_color="transparent")
@@ -251,35 +269,22 @@ class MainWindow:
             center_frame = ctk.CTkFrame(status_container, fg_color="transparent")
             center_frame.pack(expand=True)
             
-            # Queue label
+            # Queue and active download labels; each carries its count in the
+            # text so the status bar is two widgets rather than four
             self.queue_label = ctk.CTkLabel(
                 center_frame,
-                text="Queue:",
-                font=ctk.CTkFont(size=16, weight="bold")
-            )
-            self.queue_label.pack(side="left", padx=(0,2))
-            
-            self.queue_count = ctk.CTkLabel(
-                center_frame,
-                text="0",
-                font=ctk.CTkFont(size=16, weight="bold")
+                text="Queue: 0",
+                font=self.status_font
             )
-            self.queue_count.pack(side="left", padx=(0,20))
+            self.queue_label.pack(side="left", padx=(0,20))
 
-            # Active downloads label
             self.active_label = ctk.CTkLabel(
                 center_frame,
-                text="Active Downloads:",
-                font=ctk.CTkFont(size=16, weight="bold")
+                text="Active Downloads: 0",
+                font=self.status_font
             )
-            self.active_label.pack(side="left", padx=(0,2))
-            
-            self.active_count = ctk.CTkLabel(
-                center_frame,
-                text="0",
-                font=ctk.CTkFont(size=16, weight="bold")
-            )
-            self.active_count.pack(side="left")
+            self.active_label.pack(side="left")
+            self._counts_scheduled = False  # A label refresh is waiting for idle
 
             # Window close handler
             logger.debug("Setting up window close handler")
@@ -314,22 +319,21 @@ class MainWindow:
         """Remove download widget"""
         try:
             logger.info(f"Removing download widget {widget_id}")
-            if widget_id in self.downloads:
-                # Get widget and process ID
-                widget = self.downloads[widget_id]
+            # Pop the widget in the same lookup that checks for it
+            widget = self.downloads.pop(widget_id, None)
+            if widget is not None:
+                # Get process ID
                 process_id = widget.process_id
                 
                 # Remove from active downloads if present
-                if process_id and process_id in self.active_downloads:
-                    self.active_downloads.remove(process_id)
+                if process_id:
+                    self.active_downloads.discard(process_id)
                 
                 # Remove from pending downloads if present
-                self.pending_downloads = [(wid, url, settings) for wid, url, settings in self.pending_downloads 
-                                       if wid != widget_id]
+                self.pending_downloads.pop(widget_id, None)
                 
                 # Remove widget from UI
                 widget.destroy()
-                del self.downloads[widget_id]
                 
                 # Clean up process if it exists
                 if process_id:
@@ -347,84 +351,87 @@ class MainWindow:
         
     def _update_progress(self):
         """Update progress for all downloads"""
+        updates = {}
         try:
-            updates = []
             # Process all queued progress updates
-            while True:
+            for _ in range(100):  # Drain up to 100 messages per tick to keep the GUI responsive
                 try:
-                    # Collect up to 100 updates at a time to prevent overwhelming the GUI
-                    if len(updates) >= 100:
-                        break
-                    widget_id, source, progress_data = self.progress_queue.get_nowait()
-                    updates.append((widget_id, source, progress_data))
-                except Empty:
+                    widget_id, process_id, progress_data = self.progress_queue.popleft()
+                except IndexError:
                     break
+                msg_type = progress_data['type']
+                if msg_type in self.COALESCED_MESSAGES:
+                    # Only the latest value of each bar matters; it keeps the
+                    # slot of the first one so ordering against other messages holds
+                    key = (widget_id, msg_type)
+                else:
+                    key = (widget_id, msg_type, len(updates))
+                updates[key] = (widget_id, process_id, progress_data)
                     
             # Apply all updates in a batch
             if updates:
-                for widget_id, source, progress_data in updates:
-                    if widget_id in self.downloads:
-                        try:
-                            widget = self.downloads[widget_id]
-                            widget.update_progress(progress_data)
-                        except Exception as e:
-                            logger.error(f"Error updating widget {widget_id}: {str(e)}", exc_info=True)
-                
-                # Only update GUI once after all updates are processed
-                self.root.update_idletasks()
+                for widget_id, process_id, progress_data in updates.values():
+                    widget = self.downloads.get(widget_id)
+                    if widget is None:
+                        continue  # Widget was removed while the message was queued
+                    try:
+                        if widget.update_progress(progress_data):
+                            # Download ended, free its slot for pending ones
+                            self._clear_download(process_id)
+                    except Exception as e:
+                        logger.error(f"Error updating widget {widget_id}: {str(e)}", exc_info=True)
             
         except Exception as e:
             logger.error(f"Error in progress update: {str(e)}", exc_info=True)
             
         finally:
             # Schedule next update
-            if self.root.winfo_exists():
-                # Use longer interval if no updates to process
-                next_interval = 10 if not updates else 50
+            if not self._closing:
+                # Back off while idle instead of waking Tk 100 times a second
+                next_interval = 100 if not updates else 50
                 self.root.after(next_interval, self._update_progress)
                 
-    def _create_download_widget(self, title: str, url: str = "") -> str:
-        """Create a new download widget"""
-        logger.info(f"Creating download widget for: {title}")
-        
-        # Create widget
-        widget = DownloadWidget(
-            self.downloads_frame,
-            url=url,
-            title=title,
-            on_cancel=self._cancel_download
-        )
-        widget.pack(fill="x", padx=5, pady=2)
-        
-        # Store widget
-        self.downloads[widget.id] = widget
-        logger.info(f"Download widget created: {widget.id}")
-        
-        return widget.id
-        
     def _cancel_download(self, widget_id: str):
         """Cancel download process"""
         try:
             logger.info(f"Cancelling download for widget {widget_id}")
-            if widget_id in self.downloads:
-                widget = self.downloads[widget_id]
-                if hasattr(widget, 'process_id'):  # Check if process ID exists
-                    self.process_pool.terminate_process(widget.process_id)
-                    widget.set_status("Download cancelled")
-                    self._clear_download(widget.process_id)
+            widget = self.downloads.get(widget_id)
+            if widget is not None:
+                widget.set_status("Download cancelled")
+                if widget.process_id:
+                    # Stopping the process can wait up to half a second, so do it
+                    # off the Tk thread; the slot is freed once it has exited
+                    threading.Thread(
+                        target=self._terminate_download,
+                        args=(widget_id, widget.process_id),
+                        daemon=True
+                    ).start()
+                else:
+                    # Still queued, make sure it is never started
+                    self.pending_downloads.pop(widget_id, None)
+                    self._update_download_counts()
         except Exception as e:
             logger.error(f"Error cancelling download: {str(e)}", exc_info=True)
-            if widget_id in self.downloads:
-                self.downloads[widget_id].set_status("Error cancelling download")
+            widget = self.downloads.get(widget_id)
+            if widget is not None:
+                widget.set_status("Error cancelling download")
             
+    def _terminate_download(self, widget_id: str, process_id: str):
+        """Terminate a download process, then report it cancelled to the Tk thread"""
+        try:
+            self.process_pool.terminate_process(process_id)
+        except Exception as e:
+            logger.error(f"Error terminating process {process_id}: {str(e)}", exc_info=True)
+        self.progress_queue.append((widget_id, process_id, {'type': 'cancelled'}))
+        
     def _download_file(self, widget_id: str, url: str, settings: dict):
         """Download regular file"""
         try:
             # Get widget by ID
-            if widget_id not in self.downloads:
+            widget = self.downloads.get(widget_id)
+            if widget is None:
                 logger.error(f"No widget found for ID: {widget_id}")
                 return
-            widget = self.downloads[widget_id]
                 
             # Create a queue for progress updates
             progress_queue = mp.Queue()
@@ -449,7 +456,7 @@ class MainWindow:
                 
             except RuntimeError as e:
                 if "Maximum number of processes" in str(e):
-                    self.pending_downloads.append((widget_id, url, settings))
+                    self.pending_downloads[widget_id] = (url, settings)
                     widget.set_status("Queued")
                     logger.debug(f"Queued download for later: {url}")
                     self._update_download_counts()
@@ -467,10 +474,10 @@ class MainWindow:
         """Download YouTube video"""
         try:
             # Get widget by ID
-            if widget_id not in self.downloads:
+            widget = self.downloads.get(widget_id)
+            if widget is None:
                 logger.error(f"No widget found for ID: {widget_id}")
                 return
-            widget = self.downloads[widget_id]
                 
             # Create a queue for progress updates
             progress_queue = mp.Queue()
@@ -496,7 +503,7 @@ class MainWindow:
                 
             except RuntimeError as e:
                 if "Maximum number of processes" in str(e):
-                    self.pending_downloads.append((widget_id, url, settings))
+                    self.pending_downloads[widget_id] = (url, settings)
                     widget.set_status("Queued")
                     logger.debug(f"Queued download for later: {url}")
                     self._update_download_counts()
@@ -515,92 +522,53 @@ class MainWindow:
         has_video: bool
     ):
         """Monitor progress of YouTube download"""
+        # Runs off the Tk thread, so widgets are never touched here; messages are
+        # forwarded to self.progress_queue and applied by _update_progress
+        widget_id = widget.id
         try:
-            # Show appropriate progress bars
-            widget.show_audio_progress()  # Always show audio progress
-            if has_video:
-                widget.show_video_progress()  # Only show video progress if not audio-only
-                
+            # Show appropriate progress bars and the initial status
+            self.progress_queue.append((widget_id, process_id, {
+                'type': 'start',
+                'has_video': has_video,
+                'message': 'Downloading...'
+            }))
+            
             is_muxing = False  # Track if we're in muxing phase
-            widget.set_status("Downloading...")  # Initial status
+            
+            # Cap progress bar redraws at ~30 FPS per stream, intermediate values are dropped
+            MIN_UPDATE_INTERVAL = 1 / 30
+            last_update_times = {}
                 
             while True:
                 try:
-                    progress = progress_queue.get(timeout=0.1)
+                    # Returns as soon as a message arrives; the timeout only bounds
+                    # how long a dead process goes unnoticed
+                    progress = progress_queue.get(timeout=0.5)
                     
-                    if progress['type'] == 'title':
-                        # Update widget title when we get video info
-                        widget.update_title(progress['title'])
-                    elif progress['type'] == 'video_progress':
-                        data = progress.get('data', {})
-                        widget.update_video_progress(
-                            data.get('progress', 0),
-                            data.get('speed', '0MB/s'),
-                            data.get('downloaded', '0MB'),
-                            data.get('total', '0MB')
-                        )
-                    elif progress['type'] == 'audio_progress':
+                    if progress['type'] in ('video_progress', 'audio_progress', 'muxing_progress'):
+                        if progress['type'] == 'muxing_progress':
+                            is_muxing = True
                         data = progress.get('data', {})
-                        widget.update_audio_progress(
-                            data.get('progress', 0),
-                            data.get('speed', '0MB/s'),
-                            data.get('downloaded', '0MB'),
-                            data.get('total', '0MB')
-                        )
-                    elif progress['type'] == 'muxing_progress':
-                        is_muxing = True  # Set muxing flag
-                        data = progress.get('data', {})
-                        widget.show_muxing_progress()
-                        widget.update_muxing_progress(
-                            data.get('progress', 0),
-                            data.get('status', 'Muxing...')
-                        )
-                        widget.set_status("Muxing video and audio...")  # Update status during muxing
-                    elif progress['type'] == 'status':
-                        widget.set_status(progress['message'])
-                    elif progress['type'] == 'error':
-                        widget.set_status(f"Error: {progress['error']}")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        break
-                    elif progress['type'] == 'cancelled':
-                        widget.set_status("Download cancelled")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        break
-                    elif progress['type'] == 'complete':
-                        if is_muxing:
-                            widget.set_status("Finished!")  # Update status after muxing
-                        else:
-                            widget.set_status(progress.get('message', 'Finished!'))  # Use message if provided
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
+                        current_time = time.time()
+                        if (data.get('progress', 0) < 100 and
+                                current_time - last_update_times.get(progress['type'], 0) < MIN_UPDATE_INTERVAL):
+                            continue
+                        last_update_times[progress['type']] = current_time
+                    
+                    self.progress_queue.append((widget_id, process_id, progress))
+                    if progress['type'] in ('error', 'cancelled', 'complete'):
                         break
                         
                 except queue.Empty:
                     # Check if process is still running
                     if not self.process_pool.is_process_running(process_id):
                         if not is_muxing:  # Only show failure if not in muxing phase
-                            widget.set_status("Download failed")
-                            widget.is_completed = True
-                            widget.is_cancelled = True
-                            widget.cancel_btn.configure(text="Clear")
-                            self._clear_download(process_id)
+                            self.progress_queue.append((widget_id, process_id, {'type': 'failed'}))
                             break
                         
         except Exception as e:
             logger.error(f"Error monitoring progress: {str(e)}", exc_info=True)
-            widget.set_status(f"Error: {str(e)}")
-            widget.is_completed = True
-            widget.is_cancelled = True
-            widget.cancel_btn.configure(text="Clear")
-            self._clear_download(process_id)
+            self.progress_queue.append((widget_id, process_id, {'type': 'error', 'error': str(e)}))
             
     def _monitor_download_progress(
         self,
@@ -609,9 +577,11 @@ class MainWindow:
         progress_queue: mp.Queue
     ):
         """Monitor progress of file download"""
+        # Runs off the Tk thread, see _monitor_youtube_progress
+        widget_id = widget.id
         try:
             # Show audio progress bar since we're downloading a single file
-            widget.show_audio_progress()
+            self.progress_queue.append((widget_id, process_id, {'type': 'start', 'has_video': False}))
             
             last_update_time = 0
             MIN_UPDATE_INTERVAL = 0.05  # Minimum 50ms between updates
@@ -624,57 +594,25 @@ class MainWindow:
                     current_time = time.time()
                     if progress['type'] == 'progress':
                         # Only forward progress updates if enough time has passed
-                        if current_time - last_update_time >= MIN_UPDATE_INTERVAL:
-                            data = progress.get('data', {})
-                            widget.update_audio_progress(
-                                data.get('progress', 0),
-                                data.get('speed', '0MB/s'),
-                                data.get('downloaded', '0MB'),
-                                data.get('total', '0MB')
-                            )
-                            last_update_time = current_time
-                    elif progress['type'] == 'title':
-                        # Update widget title when we get file info
-                        widget.update_title(progress['title'])
-                    elif progress['type'] == 'error':
-                        widget.set_status(f"Error: {progress['error']}")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        break
-                    elif progress['type'] == 'cancelled':
-                        widget.set_status("Download cancelled")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        break
+                        if current_time - last_update_time < MIN_UPDATE_INTERVAL:
+                            continue
+                        last_update_time = current_time
                     elif progress['type'] == 'complete':
-                        widget.set_status("Download complete")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
+                        progress.setdefault('message', 'Download complete')
+                        
+                    self.progress_queue.append((widget_id, process_id, progress))
+                    if progress['type'] in ('error', 'cancelled', 'complete'):
                         break
                         
                 except queue.Empty:
                     # Check if process is still running
                     if not self.process_pool.is_process_running(process_id):
-                        widget.set_status("Download failed")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
+                        self.progress_queue.append((widget_id, process_id, {'type': 'failed'}))
                         break
                         
         except Exception as e:
             logger.error(f"Error monitoring progress: {str(e)}", exc_info=True)
-            widget.set_status(f"Error: {str(e)}")
-            widget.is_completed = True
-            widget.is_cancelled = True
-            widget.cancel_btn.configure(text="Clear")
-            self._clear_download(process_id)
+            self.progress_queue.append((widget_id, process_id, {'type': 'error', 'error': str(e)}))
             
     def _clear_download(self, process_id: str):
         """Remove a download from active downloads"""
@@ -683,60 +621,12 @@ class MainWindow:
             self._check_pending_downloads()
             self._update_download_counts()
             
-    def _check_pending_downloads(self):
-        """Check if there are pending downloads that can be started"""
-        # Clean up completed processes first
-        self.process_pool.cleanup_completed()
-        
-        # Now check how many active processes we have
-        active_processes = len([p for p in self.process_pool.processes.values() if p.is_alive()])
-
-        while active_processes < self.process_pool.max_processes and self.pending_downloads:
-            widget_id, url, settings = self.pending_downloads.pop(0)
-            try:
-                if is_youtube_url(url):
-                    self._download_youtube(widget_id, url, settings)
-                else:
-                    self._download_file(widget_id, url, settings)
-            except Exception as e:
-                logger.error(f"Error starting pending download {url}: {str(e)}", exc_info=True)
-                messagebox.showerror("Error", f"Failed to start download: {str(e)}")
-            
-            # Recalculate active processes after starting a download
-            active_processes = len([p for p in self.process_pool.processes.values() if p.is_alive()])
-
-        # Schedule next check if there are still pending downloads
-        if self.pending_downloads:
-            self.root.after(1000, self._check_pending_downloads)
-        self._update_download_counts()
-            
-    def _process_next_url(self, urls, settings, remaining_urls):
-        """Process next URL in the list asynchronously"""
-        if not urls:
-            # All URLs processed, update text box with remaining URLs
-            self.url_text.delete("1.0", "end")
-            if remaining_urls:
-                for url in remaining_urls:
-                    self.url_text.insert("end", url + "\n")
-            return
-
-        # Process URLs in batches of 5 to avoid overwhelming the system
-        batch_size = 5
-        current_batch = urls[:batch_size]
-        remaining_batch = urls[batch_size:]
-
-        # Update text box to remove the processed URLs
-        self.url_text.delete("1.0", "end")
-        # Add remaining unprocessed URLs
-        for remaining_url in remaining_batch:
-            self.url_text.insert("end", remaining_url + "\n")
-        # Add previously invalid URLs
-        for invalid_url in remaining_urls:
-            self.url_text.insert("end", invalid_url + "\n")
-
+    def _process_urls(self, urls: List[str], settings: dict):
+        """Validate all URLs concurrently and start each download as soon as its URL checks out"""
         # Create a queue to track validation results
         validation_queue = queue.Queue()
-        validation_threads = []
+        pending_urls = list(urls)  # Not yet validated, in original order
+        invalid_urls = []
 
         def validate_url(url_to_validate):
             """Validate a single URL"""
@@ -745,46 +635,50 @@ class MainWindow:
                 return
 
             try:
-                session = requests.Session()
-                session.headers.update({
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                })
                 url_to_check = url_to_validate if url_to_validate.startswith(('http://', 'https://')) else f'https://{url_to_validate}'
-                response = session.head(url_to_check, timeout=5, allow_redirects=True)
+                response = self.http_session.head(url_to_check, timeout=5, allow_redirects=True)
                 response.raise_for_status()
                 validation_queue.put((url_to_validate, True))
             except Exception as e:
                 logger.debug(f"Invalid URL {url_to_validate}: {str(e)}")
                 validation_queue.put((url_to_validate, False))
 
-        # Start validation threads for the batch
-        for url in current_batch:
-            thread = threading.Thread(target=validate_url, args=(url,), daemon=True)
-            validation_threads.append(thread)
-            thread.start()
+        # Validate the whole batch through a bounded pool instead of waiting
+        # for each group of URLs to finish before starting the next one.
+        # With a higher download limit, validate as many URLs as can start at
+        # once, up to the number of pooled connections in the shared session
+        workers = min(
+            max(self.VALIDATION_WORKERS, self.process_pool.max_processes),
+            self.MAX_VALIDATION_CONNECTIONS
+        )
+        executor = ThreadPoolExecutor(max_workers=workers)
+        for url in urls:
+            executor.submit(validate_url, url)
+        executor.shutdown(wait=False)
 
         def check_validation_results():
-            """Check validation results and start downloads"""
-            completed = 0
-            new_remaining_urls = []
-
-            # Check how many validations are complete
-            while not validation_queue.empty():
-                url, is_valid = validation_queue.get()
-                completed += 1
+            """Start downloads for validated URLs as their results arrive"""
+            changed = False
+            while True:
+                try:
+                    url, is_valid = validation_queue.get_nowait()
+                except Empty:
+                    break
+                pending_urls.remove(url)
+                changed = True
                 if is_valid:
                     # URL is valid, start or queue download
                     self._start_single_download(url, settings.copy())
                 else:
-                    new_remaining_urls.append(url)
+                    invalid_urls.append(url)
 
-            if completed < len(current_batch):
+            if changed:
+                # Keep unprocessed and invalid URLs in the text box
+                self._set_url_text(pending_urls + invalid_urls)
+
+            if pending_urls:
                 # Not all validations are complete, check again after a short delay
                 self.root.after(100, check_validation_results)
-            else:
-                # All validations in this batch are complete, process next batch
-                remaining_urls.extend(new_remaining_urls)
-                self.root.after(1, lambda: self._process_next_url(remaining_batch, settings, remaining_urls))
 
         # Start checking validation results
         self.root.after(100, check_validation_results)
@@ -793,7 +687,8 @@ class MainWindow:
         """Start or queue a single download"""
         # Create widget with format info in title
         title = get_filename_from_url(url)
-        if is_youtube_url(url):
+        is_youtube = is_youtube_url(url)  # Classified once for the title and the download
+        if is_youtube:
             format_info = "Audio" if settings['audio_only'] else "Video"
             if settings['audio_only']:
                 format_info += f" ({settings['audio_quality']})"
@@ -801,7 +696,7 @@ class MainWindow:
                 format_info += f" ({settings['video_quality']}, {settings['audio_quality']})"
             title = f"{title} - {format_info}"
             
-        # Create widget and store it using its UUID
+        # Create widget and store it using its ID
         widget = DownloadWidget(
             self.downloads_frame,
             url=url,
@@ -813,13 +708,13 @@ class MainWindow:
         
         if len(self.active_downloads) < self.process_pool.max_processes:
             # Start download immediately
-            if is_youtube_url(url):
+            if is_youtube:
                 self._download_youtube(widget.id, url, settings)
             else:
                 self._download_file(widget.id, url, settings)
         else:
             # Otherwise queue it
-            self.pending_downloads.append((widget.id, url, settings))
+            self.pending_downloads[widget.id] = (url, settings)
             widget.set_status("Queued")
             # Hide progress frame for queued downloads
             widget.hide_progress_frame()
@@ -832,7 +727,7 @@ class MainWindow:
         """Start downloading all URLs"""
         try:
             # Get URLs from text box
-            all_urls = [url.strip() for url in self.url_text.get("1.0", "end").split("\n") if url.strip()]
+            all_urls = list(self._iter_urls())
             if not all_urls:
                 return
             
@@ -840,30 +735,16 @@ class MainWindow:
             has_playlists = any("list=" in url for url in all_urls)
             
             if has_playlists:
-                # Only handle playlists, keep other URLs in the text field
-                remaining_urls = []
-                extracted_videos = []
-                
-                for url in all_urls:
-                    if "list=" in url:
-                        try:
-                            playlist_urls = YouTubeDownloader.get_playlist_urls(url)
-                            if playlist_urls:
-                                logger.info(f"Found {len(playlist_urls)} videos in playlist")
-                                extracted_videos.extend(playlist_urls)
-                            else:
-                                logger.debug(f"No videos found in playlist: {url}")
-                                remaining_urls.append(url)
-                        except Exception as e:
-                            logger.debug(f"Failed to get playlist info: {str(e)}")
-                            remaining_urls.append(url)
-                    else:
-                        remaining_urls.append(url)
-                
-                # Update text box with remaining URLs and extracted videos
-                self.url_text.delete("1.0", "end")
-                for url in remaining_urls + extracted_videos:
-                    self.url_text.insert("end", url + "\n")
+                # Playlist extraction does network I/O, so run it off the UI thread
+                # and keep the button disabled until the results are applied
+                self.download_btn.configure(state="disabled")
+                playlist_queue = queue.Queue()
+                threading.Thread(
+                    target=self._extract_playlists,
+                    args=(all_urls, playlist_queue),
+                    daemon=True
+                ).start()
+                self.root.after(100, self._check_playlist_results, playlist_queue)
                 return
                 
             # Get current settings
@@ -875,11 +756,68 @@ class MainWindow:
             }
             
             # Start processing URLs asynchronously
-            self._process_next_url(all_urls.copy(), settings, [])
+            self._process_urls(all_urls, settings)
             
         except Exception as e:
             logger.error(f"Error starting downloads: {str(e)}", exc_info=True)
             
+    def _extract_playlists(self, all_urls: List[str], result_queue: queue.Queue):
+        """Extract playlist entries in a worker thread"""
+        # Keep the original URLs in the text field if extraction fails
+        result = all_urls
+        try:
+            # Only handle playlists, keep other URLs in the text field
+            remaining_urls = []
+            extracted_videos = []
+            
+            for url in all_urls:
+                if "list=" in url:
+                    try:
+                        playlist_urls = YouTubeDownloader.get_playlist_urls(url)
+                        if playlist_urls:
+                            logger.info(f"Found {len(playlist_urls)} videos in playlist")
+                            extracted_videos.extend(playlist_urls)
+                        else:
+                            logger.debug(f"No videos found in playlist: {url}")
+                            remaining_urls.append(url)
+                    except Exception as e:
+                        logger.debug(f"Failed to get playlist info: {str(e)}")
+                        remaining_urls.append(url)
+                else:
+                    remaining_urls.append(url)
+                    
+            result = remaining_urls + extracted_videos
+        except Exception as e:
+            logger.error(f"Error extracting playlists: {str(e)}", exc_info=True)
+        finally:
+            # Always hand a result back, the Tk thread re-enables the button on it
+            result_queue.put(result)
+        
+    def _check_playlist_results(self, result_queue: queue.Queue):
+        """Update text box with remaining URLs and extracted videos once extraction is done"""
+        try:
+            urls = result_queue.get_nowait()
+        except Empty:
+            # Extraction still running, check again after a short delay
+            self.root.after(100, self._check_playlist_results, result_queue)
+            return
+        self._set_url_text(urls)
+        self.download_btn.configure(state="normal")
+        
+    def _iter_urls(self):
+        """Yield the non-empty, stripped lines of the URL box"""
+        for line in self.url_text.get("1.0", "end").splitlines():
+            url = line.strip()
+            if url:
+                yield url
+                
+    def _set_url_text(self, urls: List[str]):
+        """Replace the URL box contents with one URL per line"""
+        self.url_text.delete("1.0", "end")
+        if urls:
+            # Single insert, so the text widget re-lays out once instead of per line
+            self.url_text.insert("end", "\n".join(urls) + "\n")
+            
     def _on_folder_change(self, folder: Path):
         """Handle download folder change"""
         pass  # Nothing to do, folder is stored in settings
@@ -901,6 +839,7 @@ class MainWindow:
         
     def _on_closing(self):
         """Handle window closing"""
+        self._closing = True  # Stops the progress pump from rescheduling itself
         try:
             # Clean up all running processes
             logger.info("Cleaning up processes before exit")
@@ -908,6 +847,7 @@ class MainWindow:
             
             # Destroy the window
             logger.info("Destroying main window")
+            self.http_session.close()
             self.root.destroy()
             
         except Exception as e:
@@ -920,17 +860,35 @@ class MainWindow:
             # Reset modified flag (required for <<Modified>> event to work properly)
             self.url_text.edit_modified(False)
             
-            # Check content for playlist URLs
-            urls = [url.strip() for url in self.url_text.get("1.0", "end").split("\n") if url.strip()]
-            has_playlists = any("list=" in url for url in urls)
+            # Debounce: rescan once typing or pasting pauses, not on every edit
+            if self._url_check_after_id is not None:
+                self.root.after_cancel(self._url_check_after_id)
+            self._url_check_after_id = self.root.after(self.URL_CHECK_DELAY, self._update_download_button)
+        except Exception as e:
+            logger.error(f"Error updating button text: {str(e)}", exc_info=True)
+            
+    def _update_download_button(self):
+        """Switch the download button between download and playlist mode"""
+        self._url_check_after_id = None
+        try:
+            # <<Modified>> also fires for edits that leave the text as it was
+            # (e.g. typing and deleting a character), so skip an unchanged box
+            text = self.url_text.get("1.0", "end")
+            if text == self._url_text_seen:
+                return
+            self._url_text_seen = text
+            
+            # Check content for playlist URLs. "list=" never spans a line break
+            # and stripping never removes it, so one search over the whole
+            # buffer gives the same answer as checking line by line
+            has_playlists = "list=" in text
+            if has_playlists == self._has_playlists:
+                return  # Button already shows the right mode
+            self._has_playlists = has_playlists
             
-            # Update button text
+            # Update button text and colors; text color and font never change
             self.download_btn.configure(
-                text="Extract Playlists" if has_playlists else "Start Downloads",
-                fg_color="#d29922" if has_playlists else "#2ea043",  # Warm yellow for playlists, GitHub-style green for downloads
-                hover_color="#bf8700" if has_playlists else "#2c974b",  # Darker yellow for hover on playlists, darker green for hover on downloads
-                text_color="black",
-                font=("", 13, "bold")
+                **(self.PLAYLIST_BUTTON_STYLE if has_playlists else self.DOWNLOAD_BUTTON_STYLE)
             )
         except Exception as e:
             logger.error(f"Error updating button text: {str(e)}", exc_info=True)
@@ -938,17 +896,14 @@ class MainWindow:
     def _cancel_queued_downloads(self):
         """Cancel all queued downloads"""
         # Get list of queued downloads
-        queued_widgets = []
-        for widget_id, widget in self.downloads.items():
-            if not widget.process_id:  # No process ID means it's queued
-                queued_widgets.append(widget_id)
+        queued_widgets = [self.downloads[widget_id] for widget_id in self.pending_downloads
+                          if widget_id in self.downloads]
                 
         # Cancel each queued download
-        for widget_id in queued_widgets:
-            widget = self.downloads[widget_id]
+        for widget in queued_widgets:
             widget.is_cancelled = True
             widget.set_status("Download cancelled")
-            widget.cancel_btn.configure(text="Clear")
+            widget.show_clear_button()
             
         # Clear the pending URLs list
         self.pending_downloads.clear()
@@ -971,106 +926,47 @@ class MainWindow:
             if not widget.is_completed:  # Don't modify completed downloads
                 widget.is_cancelled = True
                 widget.set_status("Download cancelled")
-                widget.cancel_btn.configure(text="Clear")
+                widget.show_clear_button()
                 
-                # Cancel the process if it's active
-                if hasattr(widget, 'process_id') and widget.process_id:
-                    self.process_pool.terminate_process(widget.process_id)
-                    self._clear_download(widget.process_id)
+                # Cancel the process if it's active; like a single cancel this
+                # happens off the Tk thread, and all processes stop in parallel
+                if widget.process_id:
+                    threading.Thread(
+                        target=self._terminate_download,
+                        args=(widget_id, widget.process_id),
+                        daemon=True
+                    ).start()
                     
+        self._update_download_counts()
+        
     def _update_download_counts(self):
+        """Schedule a refresh of the queue and active download counts"""
+        # Starting or finishing a batch calls this once per download; collapse
+        # them into a single label update when Tk goes idle
+        if not self._counts_scheduled:
+            self._counts_scheduled = True
+            self.root.after_idle(self._refresh_download_counts)
+            
+    def _refresh_download_counts(self):
         """Update the queue and active download counts"""
+        self._counts_scheduled = False
         queue_count = len(self.pending_downloads)
         active_count = len(self.active_downloads)
         
-        self.queue_count.configure(text=str(queue_count))
-        self.active_count.configure(text=str(active_count))
+        self.queue_label.configure(text=f"Queue: {queue_count}")
+        self.active_label.configure(text=f"Active Downloads: {active_count}")
 
     def run(self):
         """Start the application"""
         self.root.mainloop()
 
-    def _handle_download_error(self, process_id, error_msg):
-        """Handle download error"""
-        if process_id in self.active_downloads:
-            self.active_downloads.remove(process_id)
-            self._process_pending_downloads()
-            self._update_download_counts()
-        logger.error(f"Download error: {error_msg}")
-
-    def _process_progress_updates(self):
-        """Process any progress updates from the progress queue"""
-        try:
-            while True:  # Process all available updates
-                update = self.progress_queue.get_nowait()
-                process_id = update.get('process_id')
-                if process_id in self.downloads:
-                    widget = self.downloads[process_id]
-                    
-                    if 'error' in update:
-                        # Handle error
-                        error_msg = str(update['error'])
-                        widget.set_status(f"Error: {error_msg}")
-                        widget.cancel_btn.configure(text="Clear")
-                        self._handle_download_error(process_id, error_msg)
-                        self._update_download_counts()
-                        
-                    elif update.get('status') == 'completed':
-                        # Handle completion
-                        widget.set_status("Completed")
-                        widget.is_completed = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        self._update_download_counts()
-                        
-                    elif 'progress' in update:
-                        # Update progress
-                        progress = update['progress']
-                        if 'video' in progress:
-                            widget.show_video_progress()
-                            widget.update_video_progress(
-                                progress['video'].get('progress', 0),
-                                progress['video'].get('speed', '0 KB/s'),
-                                progress['video'].get('downloaded', '0 MB'),
-                                progress['video'].get('total', '0 MB')
-                            )
-                        if 'audio' in progress:
-                            widget.show_audio_progress()
-                            widget.update_audio_progress(
-                                progress['audio'].get('progress', 0),
-                                progress['audio'].get('speed', '0 KB/s'),
-                                progress['audio'].get('downloaded', '0 MB'),
-                                progress['audio'].get('total', '0 MB')
-                            )
-                        if 'muxing' in progress:
-                            widget.show_muxing_progress()
-                            widget.update_muxing_progress(
-                                progress['muxing'].get('progress', 0),
-                                progress['muxing'].get('status', 'Muxing...')
-                            )
-                        # Update single progress bar for regular downloads
-                        elif 'progress' in progress:
-                            widget.show_video_progress()
-                            widget.update_video_progress(
-                                progress.get('progress', 0),
-                                progress.get('speed', '0 KB/s'),
-                                progress.get('downloaded', '0 MB'),
-                                progress.get('total', '0 MB')
-                            )
-                
-        except queue.Empty:
-            pass  # No more updates to process
-        except Exception as e:
-            logger.error(f"Error processing progress updates: {str(e)}", exc_info=True)
-        finally:
-            # Schedule next update
-            self.root.after(100, self._process_progress_updates)
-
     def _check_pending_downloads(self):
         """Check if there are pending downloads that can be started"""
         while (len(self.active_downloads) < self.process_pool.max_processes and 
                self.pending_downloads):
-            widget_id, url, settings = self.pending_downloads.pop(0)
+            # Oldest queued download first
+            widget_id = next(iter(self.pending_downloads))
+            url, settings = self.pending_downloads.pop(widget_id)
             try:
                 if is_youtube_url(url):
                     self._download_youtube(widget_id, url, settings)
@@ -1079,9 +975,6 @@ class MainWindow:
             except Exception as e:
                 logger.error(f"Error starting pending download {url}: {str(e)}", exc_info=True)
                 messagebox.showerror("Error", f"Failed to start download: {str(e)}")
-            
-            # Recalculate active processes after starting a download
-            active_processes = len([p for p in self.process_pool.processes.values() if p.is_alive()])
 
         # Update counts after processing pending downloads
         self._update_download_counts()
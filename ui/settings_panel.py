@@ -1,4 +1,5 @@
 import customtkinter as ctk
+import re
 from pathlib import Path
 from typing import Callable, Dict, Optional
 from utils.logger import Logger
@@ -64,11 +65,15 @@ class SettingsPanel(ctk.CTkFrame):
             )
             
             self.max_downloads_var = ctk.StringVar(value="4")
+            # Let Tk reject non-digit keystrokes so the value always parses
+            digits_only = (self.register(self._is_digits), '%P')
             max_downloads_entry = ctk.CTkEntry(
                 max_downloads_frame,
                 textvariable=self.max_downloads_var,
                 width=50,
-                justify="center"
+                justify="center",
+                validate="key",
+                validatecommand=digits_only
             )
             max_downloads_entry.pack(side="left", padx=5)
             max_downloads_entry.bind('<FocusOut>', self._validate_max_downloads)
@@ -90,10 +95,14 @@ class SettingsPanel(ctk.CTkFrame):
                 from_=1,
                 to=8,
                 number_of_steps=7,
-                variable=self.thread_var,
-                command=self._on_thread_change
+                variable=self.thread_var
             )
             thread_slider.pack(side="left", expand=True, padx=5)
+            # Only notify once per drag gesture; the label below mirrors
+            # thread_var directly so no Python callback runs while dragging
+            thread_slider.bind("<ButtonRelease-1>", self._on_thread_change)
+            
+            self._notified_threads = self.thread_var.get()  # Last value passed to on_threads_change
             
             thread_label = ctk.CTkLabel(thread_frame, textvariable=self.thread_var)
             thread_label.pack(side="left", padx=5)
@@ -104,14 +113,10 @@ class SettingsPanel(ctk.CTkFrame):
             format_frame = ctk.CTkFrame(self)
             format_frame.pack(fill="x", padx=10, pady=5)
             
-            # Create inner frame to maintain order of elements
-            inner_frame = ctk.CTkFrame(format_frame, fg_color="transparent")
-            inner_frame.pack(fill="x", padx=0, pady=0)
-            
             # Audio only toggle
             self.audio_only = ctk.BooleanVar(value=False)
             audio_only_check = ctk.CTkCheckBox(
-                inner_frame,
+                format_frame,
                 text="Audio Only",
                 variable=self.audio_only,
                 command=self._on_audio_only_toggle
@@ -120,7 +125,7 @@ class SettingsPanel(ctk.CTkFrame):
             logger.debug(f"Initial audio only: {self.audio_only.get()}")
             
             # Audio quality
-            audio_frame = ctk.CTkFrame(inner_frame)
+            audio_frame = ctk.CTkFrame(format_frame)
             audio_frame.pack(fill="x", pady=2)
             
             ctk.CTkLabel(audio_frame, text="Audio Quality:").pack(
@@ -140,7 +145,7 @@ class SettingsPanel(ctk.CTkFrame):
             logger.debug(f"Initial audio quality: {self.audio_quality.get()}")
             
             # Video quality
-            self.quality_frame = ctk.CTkFrame(inner_frame)
+            self.quality_frame = ctk.CTkFrame(format_frame)
             self.quality_frame.pack(fill="x", pady=2)
             
             ctk.CTkLabel(self.quality_frame, text="Video Quality:").pack(
@@ -172,7 +177,8 @@ class SettingsPanel(ctk.CTkFrame):
         if is_audio_only:
             self.quality_frame.pack_forget()
         else:
-            # Simply pack at the end of inner_frame, which maintains order
+            # Video quality is the last element of the format frame, so packing
+            # it at the end restores the original order
             self.quality_frame.pack(fill="x", pady=2)
             
         if self.on_format_change:
@@ -190,9 +196,12 @@ class SettingsPanel(ctk.CTkFrame):
             if self.on_folder_change:
                 self.on_folder_change(Path(folder))
                 
-    def _on_thread_change(self, value):
+    def _on_thread_change(self, event=None):
         """Handle thread count change"""
-        threads = int(float(value))  # Convert from float to int
+        threads = self.thread_var.get()  # IntVar already holds the rounded step
+        if threads == self._notified_threads:
+            return  # Released without landing on a new step
+        self._notified_threads = threads
         logger.debug(f"Thread count changed to {threads}")
         if self.on_threads_change:
             self.on_threads_change(threads)
@@ -207,22 +216,20 @@ class SettingsPanel(ctk.CTkFrame):
         if self.on_format_change:
             self.on_format_change()
             
+    @staticmethod
+    def _is_digits(proposed: str) -> bool:
+        """Tk validatecommand: accept only ASCII digits (or an empty field while editing)"""
+        # Not str.isdigit(), which also accepts characters like "²" that int() rejects
+        return re.fullmatch(r"[0-9]*", proposed) is not None
+            
     def _validate_max_downloads(self, event=None):
         """Validate and update max downloads value"""
-        try:
-            value = int(self.max_downloads_var.get())
-            if value < 1:
-                value = 1
-            elif value > 100:
-                value = 100
-            self.max_downloads_var.set(str(value))
-            if self.on_max_downloads_change:
-                self.on_max_downloads_change(value)
-        except ValueError:
-            # Reset to default if invalid input
-            self.max_downloads_var.set("4")
-            if self.on_max_downloads_change:
-                self.on_max_downloads_change(4)
+        text = self.max_downloads_var.get()
+        # Entry only accepts digits, so an empty field is the only invalid input
+        value = min(max(int(text), 1), 100) if text else 4
+        self.max_downloads_var.set(str(value))
+        if self.on_max_downloads_change:
+            self.on_max_downloads_change(value)
         logger.debug(f"Max concurrent downloads updated to: {self.max_downloads_var.get()}")
 
     def get_settings(self) -> Dict:
@@ -238,7 +245,5 @@ class SettingsPanel(ctk.CTkFrame):
 
     def get_max_downloads(self) -> int:
         """Get current max downloads setting"""
-        try:
-            return int(self.max_downloads_var.get())
-        except ValueError:
-            return 4
+        text = self.max_downloads_var.get()
+        return int(text) if text else 4
@@ -1,7 +1,10 @@
 import logging
 import sys
+import os
+import atexit
+import queue
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from typing import Optional
 
 class Logger:
@@ -26,7 +29,6 @@ class Logger:
             '%(levelname)s: %(message)s'
         )
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
         
         # File handler (DEBUG and above, rotating)
         file_handler = RotatingFileHandler(
@@ -39,10 +41,46 @@ class Logger:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        self.handlers = [console_handler, file_handler]
+        
+        # Callers, including the UI thread, only enqueue records; formatting and
+        # console/file writes happen in batches on the listener's thread
+        log_queue = queue.SimpleQueue()
+        self.queue_handler = QueueHandler(log_queue)
+        self.logger.addHandler(self.queue_handler)
+        self.listener = QueueListener(log_queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+        self._listening = True
+        atexit.register(self._pause_listener)
+        
+        # A forked child has no listener thread, so it writes directly instead
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(
+                before=self._pause_listener,
+                after_in_parent=self._resume_listener,
+                after_in_child=self._use_direct_handlers
+            )
         
         Logger._instance = self
         
+    def _pause_listener(self):
+        """Write out all queued records, so a forked child does not inherit them"""
+        if self._listening:
+            self.listener.stop()
+            
+    def _resume_listener(self):
+        """Restart the listener thread after forking"""
+        if self._listening:
+            self.listener.start()
+            
+    def _use_direct_handlers(self):
+        """Swap the queue handler for the real handlers in a forked process"""
+        if self._listening:
+            self._listening = False
+            self.logger.removeHandler(self.queue_handler)
+            for handler in self.handlers:
+                self.logger.addHandler(handler)
+        
     @staticmethod
     def get_instance() -> logging.Logger:
         if Logger._instance is None:
@@ -1,16 +1,8 @@
 from pathlib import Path
 from urllib.parse import urlparse, unquote
 import os
-import re
-
-def is_youtube_url(url: str) -> bool:
-    """Check if URL is a YouTube video URL"""
-    patterns = [
-        r'^https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'^https?://(?:www\.)?youtube\.com/v/[\w-]+',
-        r'^https?://youtu\.be/[\w-]+'
-    ]
-    return any(re.match(pattern, url) for pattern in patterns)
+from .utils_downloader import format_size, format_speed
+from .utils_ui import is_youtube_url
 
 def sanitize_filename(filename: str) -> str:
     """Remove invalid characters from filename"""
@@ -30,18 +22,6 @@ def get_filename_from_url(url: str) -> str:
         filename = 'download'
     return sanitize_filename(filename)
 
-def format_size(size_bytes: int) -> str:
-    """Format size in bytes to human readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
-
-def format_speed(speed_bytes: float) -> str:
-    """Format speed in bytes/sec to human readable string"""
-    return f"{format_size(speed_bytes)}/s"
-
 def ensure_unique_path(path: Path) -> Path:
     """Ensure path is unique by adding number suffix if needed"""
     if not path.exists():
@@ -1,10 +1,13 @@
+# Unit thresholds from largest to smallest, so each value needs one division
+_SIZE_UNITS = ((1024 ** 4, 'TB'), (1024 ** 3, 'GB'), (1024 ** 2, 'MB'), (1024, 'KB'))
+
+
 def format_size(size_bytes: int) -> str:
     """Format size in bytes to human readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    for threshold, unit in _SIZE_UNITS:
+        if size_bytes >= threshold:
+            return f"{size_bytes / threshold:.1f} {unit}"
+    return f"{size_bytes:.1f} B"
 
 
 def format_speed(speed_bytes: float) -> str:
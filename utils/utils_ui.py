@@ -3,14 +3,16 @@ import re
 import os
 
 
+# All YouTube video URL forms in one pattern, compiled once at import.
+# Scheme and host match case-insensitively like browsers do; the path stays exact
+_YOUTUBE_URL_RE = re.compile(
+    r'^(?i:https?://)(?:(?i:(?:www\.)?youtube\.com)/(?:watch\?v=|v/)|(?i:youtu\.be)/)[\w-]+'
+)
+
+
 def is_youtube_url(url: str) -> bool:
     """Check if URL is a YouTube video URL"""
-    patterns = [
-        r'^https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'^https?://(?:www\.)?youtube\.com/v/[\w-]+',
-        r'^https?://youtu\.be/[\w-]+'
-    ]
-    return any(re.match(pattern, url) for pattern in patterns)
+    return _YOUTUBE_URL_RE.match(url) is not None
 
 
 def sanitize_filename(filename: str) -> str: